@@ -0,0 +1,137 @@
+# 🌍 Cross-Cultural Political Sentiment - Interaktives Dashboard
+# Langlaufender lokaler Streamlit-Service über vorberechneten Aggregaten
+#
+# Start:
+#   python src/sentiment_analysis.py          # erzeugt results/sentiment_aggregates.npz
+#   streamlit run app/dashboard.py
+#
+# Methodik:
+# - Aggregate (AggregateStore) werden einmal pro Prozess geladen
+# - Slice-Abfragen (Länder, Zeitraum, Granularität, Metrik) laufen über
+#   kumulierte Summen im Speicher, Rohdaten werden nie gelesen
+# - Gerenderte Figuren liegen in einem prozessweiten LRU-Cache (st.cache_resource),
+#   der die Skript-Neuläufe von Streamlit überdauert
+
+import os
+import sys
+
+import numpy as np
+import plotly.graph_objects as go
+import streamlit as st
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, 'src'))
+
+from aggregate_store import AggregateStore, GRANULARITIES, METRICS  # noqa: E402
+
+AGGREGATES_PATH = os.environ.get(
+    'SENTIMENT_AGGREGATES', os.path.join(ROOT_DIR, 'results', 'sentiment_aggregates.npz')
+)
+
+GRANULARITY_LABELS = {'D': 'Täglich', 'W': 'Wöchentlich', 'M': 'Monatlich'}
+METRIC_LABELS = {
+    'mean': 'Durchschnittliches Sentiment',
+    'std': 'Sentiment Volatilität (Std)',
+    'posts': 'Posts',
+    'count': 'Beobachtungen'
+}
+
+
+@st.cache_resource
+def load_store(path=AGGREGATES_PATH):
+    """
+    Lädt die vorberechneten Aggregate einmal pro Service-Prozess
+    """
+    return AggregateStore.load(path)
+
+
+FIGURE_CACHE_SIZE = 256
+
+
+@st.cache_resource
+def figure_cache_stats():
+    """
+    Prozessweite Zähler für den Figuren-Cache (Anfragen, neu gerenderte Figuren)
+    """
+    return {'requests': 0, 'renders': 0}
+
+
+@st.cache_resource(max_entries=FIGURE_CACHE_SIZE)
+def render_figure(countries, start, end, granularity, metric):
+    """
+    Rendert Figur und Datenframe für einen Slice (LRU-gecacht)
+
+    Alle Argumente sind hashbar (Tupel/Strings), damit sie als Cache-Schlüssel taugen.
+    Der Funktionskörper läuft nur bei einem Cache-Fehlschlag.
+
+    Returns:
+        (fig, frame)
+    """
+    figure_cache_stats()['renders'] += 1
+    frame = load_store().query(countries, start, end, granularity, metric)
+
+    fig = go.Figure()
+    for country in frame.columns:
+        fig.add_trace(
+            go.Scatter(
+                x=frame.index,
+                y=frame[country],
+                mode='lines+markers' if granularity != 'D' else 'lines',
+                name=country.title()
+            )
+        )
+    fig.update_layout(
+        title=f"{METRIC_LABELS[metric]} ({GRANULARITY_LABELS[granularity]})",
+        xaxis_title='Zeitraum',
+        yaxis_title=METRIC_LABELS[metric],
+        height=500
+    )
+    return fig, frame
+
+
+def main():
+    st.set_page_config(page_title='Cross-Cultural Political Sentiment', layout='wide')
+    st.title('🌍 Cross-Cultural Political Sentiment Analysis')
+    st.caption('⚠️ Simulationsstudie: Die Aggregate basieren auf SIMULIERTEN Daten.')
+
+    if not os.path.exists(AGGREGATES_PATH):
+        st.error(f"Keine Aggregate gefunden: {AGGREGATES_PATH}\n\n"
+                 "Bitte zuerst `python src/sentiment_analysis.py` ausführen.")
+        st.stop()
+
+    store = load_store()
+    first, last = (d.astype('O') for d in store.date_range)
+
+    with st.sidebar:
+        countries = st.multiselect(
+            'Länder', store.countries, default=store.countries,
+            format_func=str.title
+        )
+        date_range = st.date_input('Zeitraum', value=(first, last),
+                                   min_value=first, max_value=last)
+        granularity = st.radio('Granularität', GRANULARITIES,
+                               format_func=GRANULARITY_LABELS.get, index=1)
+        metric = st.selectbox('Metrik', METRICS, format_func=METRIC_LABELS.get)
+
+    if not countries:
+        st.info('Bitte mindestens ein Land auswählen.')
+        return
+    if not isinstance(date_range, (tuple, list)) or len(date_range) != 2:
+        st.info('Bitte Start- und Enddatum auswählen.')
+        return
+
+    start, end = (str(np.datetime64(d, 'D')) for d in date_range)
+    stats = figure_cache_stats()
+    stats['requests'] += 1
+    fig, frame = render_figure(tuple(sorted(countries)), start, end, granularity, metric)
+    st.plotly_chart(fig, use_container_width=True)
+
+    with st.expander('Daten'):
+        st.dataframe(frame)
+
+    st.caption(f"Figuren-Cache: {stats['requests'] - stats['renders']} Treffer, "
+               f"{stats['renders']} Fehlschläge (max. {FIGURE_CACHE_SIZE} Einträge)")
+
+
+if __name__ == '__main__':
+    main()
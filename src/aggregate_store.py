@@ -0,0 +1,278 @@
+# 📦 Vorberechnete Sentiment-Aggregate für schnelle Slice-Abfragen
+# Basis für das interaktive Dashboard (app/dashboard.py)
+#
+# Methodik:
+# - Einmalige Verdichtung der Rohdaten auf Tages-Buckets pro Land
+#   (Summe, Quadratsumme, Anzahl Beobachtungen, Posts)
+# - Kumulierte Summen pro Land: jede Abfrage (Länder, Zeitraum, Granularität,
+#   Metrik) wird über Differenzen an Bucket-Grenzen beantwortet, O(Buckets)
+# - Rohdaten werden zur Abfragezeit nie angefasst
+
+import json
+
+import numpy as np
+import pandas as pd
+
+GRANULARITIES = ('D', 'W', 'M')
+METRICS = ('mean', 'std', 'posts', 'count')
+
+# Reihenfolge der kumulierten Kanäle im Array
+CUMULATIVE_COLUMNS = ('sentiment_sum', 'sentiment_sq_sum', 'n', 'posts')
+_SUM, _SQ_SUM, _COUNT, _POSTS = range(4)
+
+# Feste Bins über den Score-Bereich [-1, 1] für mergebare Histogramme (Auflösung 0.001)
+HISTOGRAM_EDGES = np.linspace(-1.0, 1.0, 2001)
+
+
+def daily_aggregates(sentiment_data):
+    """
+    Verdichtet Rohdaten auf additive Tages-Aggregate je Land
+
+    Alle Spalten sind exakt zusammenführbar (Summen, Anzahl, Min/Max), daher
+    können Teilergebnisse einzelner Partitionen per groupby().agg() vereinigt werden.
+    Unbewertete Posts (sentiment_score NaN) zählen nur zu posts, nicht zu n.
+
+    Returns:
+        DataFrame mit MultiIndex (country, day)
+    """
+    frame = sentiment_data[['country', 'date', 'sentiment_score', 'post_count']].copy()
+    frame['day'] = frame['date'].dt.floor('D')
+    frame['sq'] = frame['sentiment_score'] ** 2
+
+    return frame.groupby(['country', 'day'], sort=True).agg(
+        sentiment_sum=('sentiment_score', 'sum'),
+        sentiment_sq_sum=('sq', 'sum'),
+        n=('sentiment_score', 'count'),
+        posts=('post_count', 'sum'),
+        sentiment_min=('sentiment_score', 'min'),
+        sentiment_max=('sentiment_score', 'max')
+    )
+
+
+def merge_daily_aggregates(partials):
+    """
+    Vereinigt Tages-Aggregate mehrerer Partitionen exakt
+    """
+    combined = pd.concat(partials)
+    if not combined.index.has_duplicates:
+        return combined.sort_index()
+    return combined.groupby(level=['country', 'day'], sort=True).agg({
+        'sentiment_sum': 'sum',
+        'sentiment_sq_sum': 'sum',
+        'n': 'sum',
+        'posts': 'sum',
+        'sentiment_min': 'min',
+        'sentiment_max': 'max'
+    })
+
+
+def score_histograms(sentiment_data):
+    """
+    Zählt die Sentiment-Scores je Land in festen Bins (HISTOGRAM_EDGES)
+
+    Histogramme lassen sich per Addition exakt zusammenführen; daraus wird der
+    Median partitionierter Läufe bestimmt. Unbewertete Posts (NaN) zählen nicht.
+
+    Returns:
+        dict {country: int64-Array mit len(HISTOGRAM_EDGES) - 1 Bins}
+    """
+    frame = sentiment_data[['country', 'sentiment_score']].dropna()
+    n_bins = len(HISTOGRAM_EDGES) - 1
+    bins = np.searchsorted(HISTOGRAM_EDGES, frame['sentiment_score'].to_numpy(), side='right') - 1
+    bins = np.clip(bins, 0, n_bins - 1)
+    return {
+        country: np.bincount(bins[positions], minlength=n_bins)
+        for country, positions in frame.groupby('country', sort=False).indices.items()
+    }
+
+
+def merge_score_histograms(partials):
+    """
+    Vereinigt Score-Histogramme mehrerer Partitionen (Summe je Land)
+    """
+    merged = {}
+    for histograms in partials:
+        for country, counts in histograms.items():
+            merged[country] = merged[country] + counts if country in merged else counts.copy()
+    return merged
+
+
+def histogram_median(counts):
+    """
+    Median aus einem Score-Histogramm (lineare Interpolation im Median-Bin)
+
+    Abweichung zum exakten Median höchstens eine Bin-Breite (0.001).
+    """
+    total = counts.sum()
+    if total == 0:
+        return np.nan
+    cumulative = np.cumsum(counts)
+    target = total / 2
+    k = int(np.searchsorted(cumulative, target))
+    before = cumulative[k - 1] if k else 0
+    width = HISTOGRAM_EDGES[k + 1] - HISTOGRAM_EDGES[k]
+    return HISTOGRAM_EDGES[k] + (target - before) / counts[k] * width
+
+
+def _bucket_keys(days, granularity):
+    """
+    Bucket-Schlüssel (Starttag als datetime64[D]) für eine Tagesachse
+    """
+    if granularity == 'D':
+        return days
+    if granularity == 'W':
+        # 1970-01-01 war ein Donnerstag → Wochenbeginn Montag
+        as_int = days.astype(np.int64)
+        return (as_int - (as_int + 3) % 7).astype('datetime64[D]')
+    if granularity == 'M':
+        return days.astype('datetime64[M]').astype('datetime64[D]')
+    raise ValueError(f"Unbekannte Granularität: {granularity} (erlaubt: {GRANULARITIES})")
+
+
+class AggregateStore:
+    """
+    In-Memory-Index über tägliche Länder-Aggregate
+
+    Pro Land werden Tagesachse und kumulierte Summen (mit führender Null) gehalten.
+    Die Summe eines Intervalls [i, j) ist damit cum[j] - cum[i].
+    """
+
+    def __init__(self, days, cumulative, metadata=None):
+        self.days = days                # {country: datetime64[D] array}
+        self.cumulative = cumulative    # {country: float64 array (n+1, 4)}
+        self.metadata = metadata or {}  # {country: {'region': ..., 'classification': ...}}
+
+    @classmethod
+    def from_sentiment_data(cls, sentiment_data):
+        """
+        Verdichtet Rohdaten (eine Zeile je Beobachtung) auf Tages-Aggregate
+        """
+        metadata = {}
+        meta_columns = [c for c in ('region', 'classification', 'democracy_score')
+                        if c in sentiment_data.columns]
+        if meta_columns:
+            firsts = sentiment_data.groupby('country')[meta_columns].first()
+            metadata = firsts.to_dict(orient='index')
+
+        return cls.from_daily_aggregates(daily_aggregates(sentiment_data), metadata)
+
+    @classmethod
+    def from_daily_aggregates(cls, daily, metadata=None):
+        """
+        Baut den Index aus Tages-Aggregaten (siehe daily_aggregates())
+        """
+        daily = daily.sort_index()
+        days, cumulative = {}, {}
+        for country, block in daily.groupby(level='country', sort=False):
+            values = block[list(CUMULATIVE_COLUMNS)].to_numpy(np.float64)
+            cum = np.zeros((len(values) + 1, 4), dtype=np.float64)
+            np.cumsum(values, axis=0, out=cum[1:])
+            days[country] = block.index.get_level_values('day').values.astype('datetime64[D]')
+            cumulative[country] = cum
+
+        return cls(days, cumulative, metadata)
+
+    # ------------------------------------------------------------------
+    # Persistenz (npz, damit der Service keine Rohdaten laden muss)
+    # ------------------------------------------------------------------
+
+    def save(self, file):
+        """
+        Speichert den Index als npz (Pfad oder binäres File-Objekt)
+        """
+        arrays = {}
+        for country in self.days:
+            arrays[f'days::{country}'] = self.days[country]
+            arrays[f'cum::{country}'] = self.cumulative[country]
+        arrays['metadata'] = np.array(json.dumps(self.metadata, ensure_ascii=False, default=float))
+        np.savez(file, **arrays)
+
+    @classmethod
+    def load(cls, file):
+        days, cumulative = {}, {}
+        with np.load(file, allow_pickle=False) as data:
+            for key in data.files:
+                kind, _, country = key.partition('::')
+                if kind == 'days':
+                    days[country] = data[key]
+                elif kind == 'cum':
+                    cumulative[country] = data[key]
+            metadata = json.loads(str(data['metadata'])) if 'metadata' in data.files else {}
+        return cls(days, cumulative, metadata)
+
+    # ------------------------------------------------------------------
+    # Abfragen
+    # ------------------------------------------------------------------
+
+    @property
+    def countries(self):
+        return sorted(self.days)
+
+    @property
+    def date_range(self):
+        starts = [d[0] for d in self.days.values() if len(d)]
+        ends = [d[-1] for d in self.days.values() if len(d)]
+        return min(starts), max(ends)
+
+    def _country_slice(self, country, start, end, granularity):
+        days = self.days[country]
+        cum = self.cumulative[country]
+
+        lo = np.searchsorted(days, start, side='left')
+        hi = np.searchsorted(days, end, side='right')
+        if hi <= lo:
+            return np.empty(0, dtype='datetime64[D]'), np.empty((0, 4))
+
+        keys = _bucket_keys(days[lo:hi], granularity)
+        # Grenzen: Beginn jedes Buckets innerhalb des Slices, plus Ende
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]]) + lo
+        bounds = np.r_[starts, hi]
+        sums = cum[bounds[1:]] - cum[bounds[:-1]]
+        return keys[starts - lo], sums
+
+    @staticmethod
+    def _metric(sums, metric):
+        count = sums[:, _COUNT]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            if metric == 'mean':
+                return sums[:, _SUM] / count
+            if metric == 'std':
+                # Stichproben-Standardabweichung (ddof=1) wie pandas .std()
+                mean = sums[:, _SUM] / count
+                var = (sums[:, _SQ_SUM] - count * mean ** 2) / (count - 1)
+                return np.sqrt(np.clip(var, 0, None))
+        if metric == 'posts':
+            return sums[:, _POSTS]
+        if metric == 'count':
+            return count
+        raise ValueError(f"Unbekannte Metrik: {metric} (erlaubt: {METRICS})")
+
+    def query(self, countries=None, start=None, end=None, granularity='D', metric='mean'):
+        """
+        Slice-Abfrage über die vorberechneten Aggregate
+
+        Returns:
+            DataFrame (Index: Bucket-Start, Spalten: Länder)
+        """
+        if granularity not in GRANULARITIES:
+            raise ValueError(f"Unbekannte Granularität: {granularity} (erlaubt: {GRANULARITIES})")
+        if metric not in METRICS:
+            raise ValueError(f"Unbekannte Metrik: {metric} (erlaubt: {METRICS})")
+
+        countries = self.countries if countries is None else list(countries)
+        unknown = [c for c in countries if c not in self.days]
+        if unknown:
+            raise KeyError(f"Unbekannte Länder: {unknown}")
+
+        first, last = self.date_range
+        start = first if start is None else np.datetime64(start, 'D')
+        end = last if end is None else np.datetime64(end, 'D')
+
+        series = {}
+        for country in countries:
+            keys, sums = self._country_slice(country, start, end, granularity)
+            series[country] = pd.Series(self._metric(sums, metric), index=pd.DatetimeIndex(keys))
+
+        result = pd.DataFrame(series)
+        result.index.name = 'date'
+        return result
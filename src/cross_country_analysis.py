@@ -0,0 +1,184 @@
+# 🔗 Länderübergreifende Korrelations- und Clusteranalyse
+# Korrelationsmatrix, Lead/Lag-Kreuzkorrelationen und hierarchisches Clustering
+# der täglichen Sentiment-Dynamik für beliebig viele Länder
+#
+# Methodik:
+# - Pivotierte, zusammenhängende (Land × Zeit) float32-Matrix
+# - Z-Standardisierung je Land; Pearson-Matrix als ein BLAS-Matrixprodukt Z·Zᵀ/T
+# - Kreuzkorrelationen für alle Lags über FFT (Wiener-Khinchin), blockweise
+#   über Länder; je Block entstehen Zwischenarrays der Form (Block × Länder × n_fft),
+#   die Blockgröße wird daher aus einem Speicherbudget abgeleitet
+# - Hierarchisches Clustering (scipy) auf der Korrelationsdistanz 1 - r
+
+import numpy as np
+import pandas as pd
+from scipy import fft
+from scipy.cluster.hierarchy import fcluster, leaves_list, linkage
+from scipy.spatial.distance import squareform
+
+
+def pivot_sentiment_matrix(sentiment_data, value='sentiment_score'):
+    """
+    Pivotiert Rohdaten zu einer (Land × Tag) float32-Matrix
+
+    Fehlende Tage werden mit dem Länder-Mittelwert aufgefüllt, sodass sie nach
+    der Zentrierung keinen Beitrag zu den Korrelationen leisten.
+
+    Returns:
+        (countries, dates, matrix) mit C-zusammenhängender Matrix
+    """
+    frame = sentiment_data[['country', 'date', value]].copy()
+    frame['date'] = frame['date'].dt.floor('D')
+    pivot = frame.pivot_table(index='country', columns='date', values=value, aggfunc='mean')
+
+    matrix = np.ascontiguousarray(pivot.to_numpy(dtype=np.float32))
+    missing = np.isnan(matrix)
+    if missing.any():
+        # Neues Array statt In-place: to_numpy() kann eine schreibgeschützte Sicht liefern
+        row_means = np.nanmean(matrix, axis=1, keepdims=True)
+        matrix = np.where(missing, row_means, matrix).astype(np.float32, copy=False)
+
+    return pivot.index.to_numpy(), pivot.columns.to_numpy(), matrix
+
+
+def standardize_rows(matrix):
+    """
+    Z-Standardisierung je Land (Populations-Std, ddof=0)
+
+    Konstante Reihen werden auf 0 gesetzt statt durch 0 zu teilen.
+    """
+    matrix = np.asarray(matrix, dtype=np.float32)
+    centered = matrix - matrix.mean(axis=1, keepdims=True)
+    std = centered.std(axis=1, keepdims=True)
+    std[std == 0] = 1.0
+    return np.ascontiguousarray(centered / std, dtype=np.float32)
+
+
+def correlation_matrix(matrix):
+    """
+    Pearson-Korrelationsmatrix (Land × Land) als ein Matrixprodukt
+
+    Entspricht DataFrame.T.corr(), ohne paarweise Schleifen.
+    """
+    z = standardize_rows(matrix)
+    corr = (z @ z.T) / np.float32(z.shape[1])
+    np.clip(corr, -1.0, 1.0, out=corr)
+    np.fill_diagonal(corr, 1.0)
+    return corr
+
+
+# Speicherbudget für die Zwischenarrays eines FFT-Blocks
+DEFAULT_MEMORY_BUDGET = 256 * 1024 ** 2  # 256 MB
+
+
+def _fft_block_size(n_countries, n_fft, memory_budget):
+    """
+    Anzahl Länder je FFT-Block für ein gegebenes Speicherbudget
+
+    Pro Land im Block fallen an: Produkt der Spektren (complex64, n_fft/2+1 Werte)
+    und irfft-Ergebnis (float32, n_fft Werte) gegen alle Länder, also
+    etwa n_countries × (8 · (n_fft/2+1) + 4 · n_fft) Bytes.
+    """
+    bytes_per_row = n_countries * (8 * (n_fft // 2 + 1) + 4 * n_fft)
+    return max(1, int(memory_budget // bytes_per_row))
+
+
+def lagged_cross_correlation(matrix, max_lag=14, block_size=None,
+                             memory_budget=DEFAULT_MEMORY_BUDGET):
+    """
+    Lead/Lag-Kreuzkorrelationen für alle Länderpaare über FFT
+
+    r[i, j, k] = corr(x_i[t], x_j[t + lag_k]) mit lag_k in [-max_lag, max_lag].
+    Ein positiver Lag mit hoher Korrelation bedeutet: Land i läuft Land j voraus.
+    Normierung mit T (verzerrter Schätzer wie bei der klassischen CCF), bei Lag 0
+    identisch mit correlation_matrix().
+
+    block_size (Länder je FFT-Block) wird ohne Angabe aus memory_budget abgeleitet.
+
+    Returns:
+        (lags, r) mit r als float32-Array der Form (Länder, Länder, 2·max_lag+1)
+    """
+    z = standardize_rows(matrix)
+    n_countries, n_days = z.shape
+    max_lag = int(min(max_lag, n_days - 1))
+    lags = np.arange(-max_lag, max_lag + 1)
+
+    # Zero-Padding auf mindestens T + max_lag verhindert zirkuläre Überlappung
+    n_fft = fft.next_fast_len(n_days + max_lag, real=True)
+    spectra = fft.rfft(z, n=n_fft, axis=1)
+    conj_spectra = np.conj(spectra)
+    # Negative Lags liegen am Ende des zirkulären Ergebnisses
+    lag_index = lags % n_fft
+    if block_size is None:
+        block_size = _fft_block_size(n_countries, n_fft, memory_budget)
+
+    result = np.empty((n_countries, n_countries, len(lags)), dtype=np.float32)
+    for start in range(0, n_countries, block_size):
+        stop = min(start + block_size, n_countries)
+        cross = fft.irfft(conj_spectra[start:stop, None, :] * spectra[None, :, :],
+                          n=n_fft, axis=2)
+        result[start:stop] = cross[:, :, lag_index] / n_days
+
+    np.clip(result, -1.0, 1.0, out=result)
+    return lags, result
+
+
+def peak_lags(lags, lagged):
+    """
+    Lag und Korrelation mit maximalem Betrag je Länderpaar
+    """
+    best = np.abs(lagged).argmax(axis=2)
+    peak_corr = np.take_along_axis(lagged, best[:, :, None], axis=2)[:, :, 0]
+    return lags[best], peak_corr
+
+
+def cluster_countries(corr, n_clusters=3, method='average'):
+    """
+    Hierarchisches Clustering auf der Korrelationsdistanz d = 1 - r
+
+    Returns:
+        (linkage_matrix, labels, order) - order ist die Dendrogramm-Reihenfolge
+    """
+    distance = 1.0 - np.asarray(corr, dtype=np.float64)
+    distance = (distance + distance.T) / 2
+    np.fill_diagonal(distance, 0.0)
+    np.clip(distance, 0.0, 2.0, out=distance)
+
+    link = linkage(squareform(distance, checks=False), method=method)
+    n_clusters = max(1, min(n_clusters, len(corr)))
+    labels = fcluster(link, t=n_clusters, criterion='maxclust')
+    return link, labels, leaves_list(link)
+
+
+def analyze_cross_country_dynamics(sentiment_data, max_lag=14, n_clusters=3, method='average'):
+    """
+    Vollständige länderübergreifende Dynamik-Analyse
+
+    Returns:
+        dict mit Korrelationsmatrix, Lead/Lag-Struktur und Clustern
+    """
+    countries, dates, matrix = pivot_sentiment_matrix(sentiment_data)
+    corr = correlation_matrix(matrix)
+    lags, lagged = lagged_cross_correlation(matrix, max_lag=max_lag)
+    best_lag, peak_corr = peak_lags(lags, lagged)
+
+    if len(countries) > 1:
+        link, labels, order = cluster_countries(corr, n_clusters=n_clusters, method=method)
+    else:
+        # Clustering benötigt mindestens zwei Länder
+        link = np.empty((0, 4))
+        labels = np.ones(len(countries), dtype=int)
+        order = np.arange(len(countries))
+
+    return {
+        'countries': countries,
+        'dates': dates,
+        'correlation_matrix': pd.DataFrame(corr, index=countries, columns=countries),
+        'lags': lags,
+        'lagged_correlation': lagged,
+        'peak_lag': pd.DataFrame(best_lag, index=countries, columns=countries),
+        'peak_correlation': pd.DataFrame(peak_corr, index=countries, columns=countries),
+        'linkage': link,
+        'clusters': pd.Series(labels, index=countries, name='cluster'),
+        'dendrogram_order': countries[order]
+    }
@@ -0,0 +1,49 @@
+# ⚙️ Ausführungs-Backends für partitionierte Läufe
+# Gemeinsame Schnittstelle für PartitionedExecutor und ReportEngine
+#
+# Methodik:
+# - Ein Backend führt eine picklebare Funktion über eine Liste von Aufgaben aus
+# - Lokal seriell, lokaler Prozess-Pool oder ein verteilter Runner (Dask, Ray, ...),
+#   der ExecutionBackend.map() implementiert
+# - Bewusst ohne Abhängigkeiten auf Analyse- oder Plot-Module
+
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+
+class ExecutionBackend(ABC):
+    """
+    Schnittstelle für Ausführungs-Backends
+
+    map() führt func für jede Aufgabe aus und liefert die Ergebnisse (in beliebiger
+    Reihenfolge) als Iterator. func und Aufgaben sind picklebar.
+    """
+
+    @abstractmethod
+    def map(self, func, tasks):
+        ...
+
+
+class SerialBackend(ExecutionBackend):
+    """
+    Ausführung im aktuellen Prozess (Debugging, kleine Läufe)
+    """
+
+    def map(self, func, tasks):
+        for task in tasks:
+            yield func(task)
+
+
+class ProcessPoolBackend(ExecutionBackend):
+    """
+    Lokaler Prozess-Pool; Ergebnisse werden geliefert, sobald sie fertig sind
+    """
+
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers
+
+    def map(self, func, tasks):
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(func, task) for task in tasks]
+            for future in as_completed(futures):
+                yield future.result()
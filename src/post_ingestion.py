@@ -0,0 +1,448 @@
+# 📥 Ingestion von Post-Dumps (JSONL/CSV, optional gzip/zstd komprimiert)
+# Nächster Schritt laut Report: "Echte API-Integration" mit offline gesammelten Posts
+#
+# Methodik:
+# - JSONL: Streaming in zeilenausgerichteten Byte-Blöcken; unkomprimierte Dateien
+#   werden per mmap gelesen und blockweise ohne Kopie (memoryview) geparst
+# - CSV: Streaming-Reader, der Zeilenumbrüche in quotierten Texten beachtet
+# - Schneller Parser: Arrow JSON/CSV-Reader (pyarrow, falls installiert),
+#   sonst Standardbibliothek als Fallback
+# - Projektion auf die benötigten Felder (text, timestamp, country, language)
+# - Scoring und Aggregation pro Batch; laufend nur Tages-Aggregate im Speicher,
+#   der Speicherbedarf bleibt damit unabhängig von der Dateigröße konstant
+# - Lokaler Fixture-Generator für Testdaten (kein Netzwerk nötig)
+
+import gzip
+import io
+import json
+import mmap
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from aggregate_store import daily_aggregates, merge_daily_aggregates
+from sentiment_router import ScoringRouter
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.json as pa_json
+except ImportError:  # pragma: no cover - optionaler Fast-Path
+    pa = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - nur für .zst-Dateien nötig
+    zstandard = None
+
+FIELDS = ('text', 'timestamp', 'country', 'language')
+DEFAULT_BLOCK_SIZE = 16 * 1024 * 1024  # 16 MB
+
+
+# ----------------------------------------------------------------------
+# Dateiformate und Kompression
+# ----------------------------------------------------------------------
+
+def _detect_format(path):
+    name = os.path.basename(path).lower()
+    compression = None
+    for suffix, kind in (('.gz', 'gzip'), ('.zst', 'zstd'), ('.zstd', 'zstd')):
+        if name.endswith(suffix):
+            compression = kind
+            name = name[:-len(suffix)]
+            break
+    if name.endswith(('.jsonl', '.ndjson', '.json')):
+        return 'jsonl', compression
+    if name.endswith('.csv'):
+        return 'csv', compression
+    raise ValueError(f"Unbekanntes Dateiformat: {path} (erwartet .jsonl/.csv, optional .gz/.zst)")
+
+
+def _open_compressed(path, compression):
+    if compression == 'gzip':
+        return gzip.open(path, 'rb')
+    if compression == 'zstd':
+        if zstandard is None:
+            raise ImportError("Für .zst-Dateien wird das Paket 'zstandard' benötigt")
+        return zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), closefd=True)
+    return open(path, 'rb')
+
+
+class _CountingReader(io.RawIOBase):
+    """
+    Dateiobjekt-Hülle, die die vom Parser gelesenen (dekomprimierten) Bytes zählt
+    """
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.bytes_read = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        n = self.raw.readinto(buffer)
+        self.bytes_read += n or 0
+        return n
+
+
+def _iter_line_blocks(path, compression, block_size):
+    """
+    Liefert zeilenausgerichtete Byte-Blöcke (bytes oder memoryview)
+
+    Nur für JSONL: Zeilenumbrüche in Werten sind dort immer als \\n escaped,
+    jeder rohe Zeilenumbruch ist also eine Datensatzgrenze.
+    """
+    if compression is None:
+        # Unkomprimiert: mmap + memoryview, keine Kopie der Blockdaten
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                view = memoryview(mm)
+                try:
+                    start, size = 0, len(mm)
+                    while start < size:
+                        end = min(start + block_size, size)
+                        if end < size:
+                            newline = mm.find(b'\n', end)
+                            end = size if newline == -1 else newline + 1
+                        yield view[start:end]
+                        start = end
+                finally:
+                    view.release()
+        return
+
+    with _open_compressed(path, compression) as stream:
+        remainder = b''
+        while True:
+            chunk = stream.read(block_size)
+            if not chunk:
+                break
+            chunk = remainder + chunk
+            cut = chunk.rfind(b'\n') + 1
+            if cut == 0:
+                remainder = chunk
+                continue
+            remainder = chunk[cut:]
+            yield chunk[:cut]
+        if remainder.strip():
+            yield remainder
+
+
+# ----------------------------------------------------------------------
+# Parser (Arrow Fast-Path, Standardbibliothek als Fallback)
+# ----------------------------------------------------------------------
+
+def _parse_jsonl_block(block, fields):
+    if pa is not None:
+        table = pa_json.read_json(
+            pa.BufferReader(pa.py_buffer(block)),
+            # Arrow parst intern mehrere 1-MB-Blöcke parallel
+            read_options=pa_json.ReadOptions(use_threads=True, block_size=1 << 20)
+        )
+        present = [f for f in fields if f in table.column_names]
+        return table.select(present).to_pandas()
+
+    records = []
+    for line in bytes(block).splitlines():
+        if line.strip():
+            record = json.loads(line)
+            records.append({f: record.get(f) for f in fields})
+    return pd.DataFrame.from_records(records, columns=list(fields))
+
+
+def _iter_csv_frames(path, compression, fields, block_size):
+    """
+    Streamt eine CSV-Datei quoting-bewusst in Batches
+
+    Post-Texte enthalten oft Zeilenumbrüche in Anführungszeichen; die Blockgrenzen
+    bestimmt deshalb der CSV-Parser selbst (Arrow: newlines_in_values, pandas:
+    chunksize), nicht ein Schnitt am nächsten rohen Zeilenumbruch.
+
+    Returns (Generator):
+        (frame, n_bytes) - geparster DataFrame und seit dem letzten Batch gelesene Bytes
+    """
+    with _open_compressed(path, compression) as stream:
+        reader = _CountingReader(stream)
+        consumed = 0
+
+        if pa is not None:
+            batches = pa_csv.open_csv(
+                reader,
+                read_options=pa_csv.ReadOptions(block_size=block_size),
+                parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+                convert_options=pa_csv.ConvertOptions(
+                    include_columns=list(fields),
+                    include_missing_columns=True,
+                    column_types={'timestamp': pa.string()}
+                )
+            )
+            frames = (batch.to_pandas() for batch in batches)
+        else:
+            # Zeilen je Batch grob aus der Blockgröße (~256 Bytes je Post)
+            frames = pd.read_csv(
+                io.BufferedReader(reader),
+                usecols=lambda column: column in fields,
+                dtype={'timestamp': str},
+                chunksize=max(1, block_size // 256)
+            )
+
+        # Um einen Batch verzögert ausgeben: Arrow liest im Hintergrund voraus,
+        # die restlichen Bytes werden so dem letzten Batch zugerechnet
+        pending = None
+        for frame in frames:
+            if pending is not None:
+                current = reader.bytes_read
+                yield pending, current - consumed
+                consumed = current
+            pending = frame
+        if pending is not None:
+            yield pending, reader.bytes_read - consumed
+
+
+def _normalize_batch(frame):
+    """
+    Vereinheitlicht einen geparsten Batch auf das Pipeline-Schema
+    """
+    frame = frame.dropna(subset=['text', 'timestamp', 'country'])
+    timestamps = frame['timestamp']
+    if pd.api.types.is_numeric_dtype(timestamps):
+        dates = pd.to_datetime(timestamps, unit='s', utc=True)
+    else:
+        dates = pd.to_datetime(timestamps, utc=True, format='ISO8601')
+
+    batch = pd.DataFrame({
+        'text': frame['text'].astype(str).to_numpy(),
+        # Einheitliche Auflösung, unabhängig vom Parser (Arrow liefert s, pandas us/ns)
+        'date': dates.dt.tz_localize(None).dt.as_unit('ns').to_numpy(),
+        'country': frame['country'].astype(str).str.lower().to_numpy(),
+        'language': (frame['language'].fillna('und').astype(str).to_numpy()
+                     if 'language' in frame.columns else 'und'),
+        'post_count': 1
+    })
+    return batch
+
+
+def iter_post_batches(path, fields=FIELDS, block_size=DEFAULT_BLOCK_SIZE):
+    """
+    Liest einen Post-Dump blockweise
+
+    Returns (Generator):
+        (batch, n_bytes) - normalisierter DataFrame und gelesene (dekomprimierte) Bytes
+    """
+    file_format, compression = _detect_format(path)
+
+    if file_format == 'csv':
+        for frame, n_bytes in _iter_csv_frames(path, compression, fields, block_size):
+            if len(frame):
+                yield _normalize_batch(frame), n_bytes
+        return
+
+    for block in _iter_line_blocks(path, compression, block_size):
+        try:
+            frame = _parse_jsonl_block(block, fields)
+            n_bytes = len(block)
+        finally:
+            # Auch bei Parse-Fehlern freigeben, sonst lässt sich die mmap nicht schließen
+            if isinstance(block, memoryview):
+                block.release()
+        if len(frame):
+            yield _normalize_batch(frame), n_bytes
+
+
+# ----------------------------------------------------------------------
+# Ingestion-Pipeline: Lesen → Scoring → Aggregation
+# ----------------------------------------------------------------------
+
+def ingest_posts(path, score_func=None, block_size=DEFAULT_BLOCK_SIZE, verbose=True):
+    """
+    Streamt einen Post-Dump durch Scoring und Tages-Aggregation
+
+    score_func erhält einen Batch (DataFrame mit text, date, country, language)
+    und liefert ihn mit Spalte 'sentiment_score' zurück. Standard ist der
+    mehrsprachige ScoringRouter.
+
+    Returns:
+        dict mit Tages-Aggregaten ('daily_aggregates') und Durchsatz-Kennzahlen
+    """
+    if score_func is None:
+        score_func = ScoringRouter()
+
+    start_time = time.perf_counter()
+    daily = None
+    total_bytes = total_posts = batches = 0
+
+    for batch, n_bytes in iter_post_batches(path, block_size=block_size):
+        scored = score_func(batch)
+        partial = daily_aggregates(scored)
+        # Laufende Aggregate statt Rohzeilen: Speicher wächst nur mit Land × Tag
+        daily = partial if daily is None else merge_daily_aggregates([daily, partial])
+
+        total_bytes += n_bytes
+        total_posts += len(batch)
+        batches += 1
+        if verbose:
+            elapsed = time.perf_counter() - start_time
+            print(f"   📥 Batch {batches}: {total_posts:,} Posts, "
+                  f"{total_bytes / 1e6 / elapsed:.1f} MB/s")
+
+    elapsed = time.perf_counter() - start_time
+    return {
+        'daily_aggregates': daily,
+        'throughput': {
+            'posts': total_posts,
+            'bytes': total_bytes,
+            'batches': batches,
+            'seconds': elapsed,
+            'mb_per_second': total_bytes / 1e6 / elapsed if elapsed else 0.0,
+            'posts_per_second': total_posts / elapsed if elapsed else 0.0
+        }
+    }
+
+
+# ----------------------------------------------------------------------
+# Lokaler Fixture-Generator (Testdaten ohne Netzwerk)
+# ----------------------------------------------------------------------
+
+_FIXTURE_COUNTRIES = {
+    'deutschland': 'de', 'usa': 'en', 'frankreich': 'fr', 'uk': 'en',
+    'brasilien': 'pt', 'polen': 'pl', 'schweden': 'sv', 'italien': 'it'
+}
+# Gleiche Aussagen je Sprache (Zeile i entspricht sich über alle Sprachen)
+_FIXTURE_TEXTS = {
+    'en': (
+        "The government did a great job with the new reform",
+        "Terrible decision by parliament, this is a disaster",
+        "Elections next week, interesting debate yesterday",
+        "I love how democracy works here, very good news",
+        "Corruption again? Awful and sad for our country",
+        "Neutral update on the budget committee hearing"
+    ),
+    'de': (
+        "Die Regierung hat mit der neuen Reform eine großartige Arbeit gemacht",
+        "Schreckliche Entscheidung des Parlaments, das ist eine Katastrophe",
+        "Nächste Woche sind Wahlen, die Debatte gestern war interessant",
+        "Ich liebe, wie die Demokratie hier funktioniert, sehr gute Nachrichten",
+        "Schon wieder Korruption? Furchtbar und traurig für unser Land",
+        "Sachlicher Bericht über die Sitzung des Haushaltsausschusses"
+    ),
+    'fr': (
+        "Le gouvernement a fait un excellent travail avec la nouvelle réforme",
+        "Décision terrible du parlement, c'est une catastrophe",
+        "Les élections sont la semaine prochaine, le débat d'hier était intéressant",
+        "J'adore la façon dont la démocratie fonctionne ici, très bonne nouvelle",
+        "Encore la corruption ? Affreux et triste pour notre pays",
+        "Compte rendu neutre de la séance de la commission du budget"
+    ),
+    'pl': (
+        "Rząd wykonał świetną pracę z nową reformą",
+        "Fatalna decyzja sejmu, to jest katastrofa",
+        "Wybory w przyszłym tygodniu, wczoraj ciekawa debata",
+        "Kocham to, jak działa tu demokracja, bardzo dobre wiadomości",
+        "Znowu korupcja? Okropne i smutne dla naszego kraju",
+        "Neutralna relacja z posiedzenia komisji budżetowej"
+    ),
+    'pt': (
+        "O governo fez um ótimo trabalho com a nova reforma",
+        "Decisão terrível do congresso, isso é um desastre",
+        "Eleições na próxima semana, debate interessante ontem",
+        "Adoro como a democracia funciona aqui, notícias muito boas",
+        "Corrupção de novo? Horrível e triste para o nosso país",
+        "Relato neutro da reunião da comissão de orçamento"
+    ),
+    'sv': (
+        "Regeringen har gjort ett utmärkt jobb med den nya reformen",
+        "Fruktansvärt beslut av riksdagen, det är en katastrof",
+        "Val nästa vecka, intressant debatt i går",
+        "Jag älskar hur demokratin fungerar här, mycket goda nyheter",
+        "Korruption igen? Hemskt och sorgligt för vårt land",
+        "Neutral rapport från budgetutskottets sammanträde"
+    ),
+    'it': (
+        "Il governo ha fatto un ottimo lavoro con la nuova riforma",
+        "Decisione terribile del parlamento, è un disastro",
+        "Elezioni la prossima settimana, dibattito interessante ieri",
+        "Adoro come funziona la democrazia qui, notizie molto buone",
+        "Di nuovo corruzione? Orribile e triste per il nostro paese",
+        "Resoconto neutrale della seduta della commissione bilancio"
+    ),
+}
+
+
+def generate_post_fixture(path, n_posts=100_000, seed=42, start='2024-01-01', days=365,
+                          multiline_share=0.0):
+    """
+    Schreibt einen synthetischen Post-Dump (JSONL/CSV, optional .gz/.zst)
+
+    Format und Kompression ergeben sich aus der Dateiendung. multiline_share ist
+    der Anteil der Posts, deren Text einen Zeilenumbruch enthält (in CSV quotiert).
+    """
+    file_format, compression = _detect_format(path)
+    rng = np.random.default_rng(seed)
+
+    countries = np.array(list(_FIXTURE_COUNTRIES))
+    languages = np.array(list(_FIXTURE_COUNTRIES.values()))
+    country_idx = rng.integers(0, len(countries), n_posts)
+    country, language = countries[country_idx], languages[country_idx]
+    # Texte passend zum Sprach-Tag des Landes
+    text_table = np.array([_FIXTURE_TEXTS[lang] for lang in languages], dtype=object)
+    texts = text_table[country_idx, rng.integers(0, text_table.shape[1], n_posts)]
+    multiline = rng.random(n_posts) < multiline_share
+    texts[multiline] = texts[multiline] + "\n\n#politics"
+    origin = pd.Timestamp(start).value // 10**9
+    timestamps = origin + rng.integers(0, days * 86400, n_posts)
+    iso = pd.to_datetime(timestamps, unit='s').strftime('%Y-%m-%dT%H:%M:%SZ')
+
+    frame = pd.DataFrame({
+        'id': np.arange(n_posts),
+        'text': texts,
+        'timestamp': iso,
+        'country': country,
+        'language': language,
+        'user_followers': rng.integers(0, 10_000, n_posts)  # wird bei Ingestion verworfen
+    })
+
+    if compression == 'zstd':
+        if zstandard is None:
+            raise ImportError("Für .zst-Dateien wird das Paket 'zstandard' benötigt")
+        raw = open(path, 'wb')
+        handle = zstandard.ZstdCompressor().stream_writer(raw, closefd=True)
+    elif compression == 'gzip':
+        handle = gzip.open(path, 'wb')
+    else:
+        handle = open(path, 'wb')
+
+    with io.TextIOWrapper(handle, encoding='utf-8', newline='') as text_handle:
+        if file_format == 'csv':
+            frame.to_csv(text_handle, index=False)
+        else:
+            frame.to_json(text_handle, orient='records', lines=True, force_ascii=False)
+    return path
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Post-Dumps streamen, scoren und aggregieren')
+    parser.add_argument('path', help='JSONL/CSV-Datei, optional .gz/.zst')
+    parser.add_argument('--fixture', type=int, metavar='N_POSTS',
+                        help='Vorher einen synthetischen Dump mit N Posts erzeugen')
+    parser.add_argument('--multiline-share', type=float, default=0.0,
+                        help='Anteil der Fixture-Posts mit Zeilenumbrüchen im Text')
+    parser.add_argument('--block-size', type=int, default=DEFAULT_BLOCK_SIZE)
+    args = parser.parse_args()
+
+    if args.fixture:
+        print(f"🧪 Erzeuge Fixture mit {args.fixture:,} Posts: {args.path}")
+        generate_post_fixture(args.path, n_posts=args.fixture,
+                              multiline_share=args.multiline_share)
+
+    router = ScoringRouter()
+    result = ingest_posts(args.path, score_func=router, block_size=args.block_size)
+    stats = result['throughput']
+    print(f"\n✅ {stats['posts']:,} Posts in {stats['seconds']:.1f}s "
+          f"({stats['mb_per_second']:.1f} MB/s, {stats['posts_per_second']:,.0f} Posts/s)")
+    router.print_stats()
@@ -0,0 +1,343 @@
+# 📝 Templatebasierte, inkrementelle Report-Generierung
+# Länder- und Regionsreports für beliebig viele Einheiten aus vorberechneten Aggregaten
+#
+# Methodik:
+# - Templates werden einmal pro Prozess kompiliert (Literal/Feld-Folge mit
+#   vorbereiteten Format-Spezifikationen), Rendern ist reines Zusammenfügen
+# - Kontexte aller Einheiten werden in einem vektorisierten Durchlauf über
+#   country_stats und monthly_trends gebaut (Ränge, Regionsmittel per groupby)
+# - Jeder Abschnitt trägt einen Fingerprint seiner Eingabewerte und Templates;
+#   unveränderte Abschnitte werden aus dem Zustand des letzten Laufs übernommen,
+#   Dateien nur bei Änderungen (atomar) neu geschrieben
+# - Einheiten werden in Paketen parallel über ein ExecutionBackend gerendert
+
+import hashlib
+import json
+import os
+import re
+from datetime import datetime
+from string import Formatter
+
+from execution_backends import ProcessPoolBackend, SerialBackend
+from result_export import atomic_write
+
+STATE_FILE = '.report_state.json'
+
+
+class CompiledTemplate:
+    """
+    Vorkompiliertes Template im str.format-Stil ({feld:spezifikation})
+
+    Die Zerlegung in Literale und Felder erfolgt einmalig; fields enthält alle
+    referenzierten Kontext-Schlüssel (Grundlage für den Abschnitts-Fingerprint).
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self.parts = [
+            (literal, field, spec or '')
+            for literal, field, spec, _conversion in Formatter().parse(source)
+        ]
+        self.fields = tuple(dict.fromkeys(field for _, field, _ in self.parts if field))
+
+    def render(self, context):
+        out = []
+        for literal, field, spec in self.parts:
+            out.append(literal)
+            if field:
+                out.append(format(context[field], spec))
+        return ''.join(out)
+
+
+class Section:
+    """
+    Report-Abschnitt aus Kopf-Template und optionalem Zeilen-Template
+
+    Zeilen werden aus context[rows_key] (Liste von dicts) gerendert. Der
+    Fingerprint umfasst Eingabewerte und Template-Quelltexte, damit auch
+    geänderte Templates den Abschnitt neu rendern.
+    """
+
+    def __init__(self, name, head, row=None, rows_key='rows'):
+        self.name = name
+        self.head = CompiledTemplate(head)
+        self.row = CompiledTemplate(row) if row else None
+        self.rows_key = rows_key
+
+    def inputs(self, context):
+        values = {field: context[field] for field in self.head.fields}
+        if self.row is not None:
+            values[self.rows_key] = [
+                {field: row[field] for field in self.row.fields}
+                for row in context[self.rows_key]
+            ]
+        return values
+
+    def fingerprint(self, context):
+        templates = [self.head.source, self.row.source if self.row is not None else None]
+        payload = json.dumps([templates, self.inputs(context)], sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+    def render(self, context):
+        text = self.head.render(context)
+        if self.row is not None:
+            text += ''.join(self.row.render(row) for row in context[self.rows_key])
+        return text
+
+
+SIMULATION_NOTICE = "⚠️ *Simulationsstudie: Die Ergebnisse basieren auf SIMULIERTEN Daten.*\n\n"
+
+COUNTRY_SECTIONS = (
+    Section('kopf',
+            "# 🌍 {country_title} – Politisches Sentiment\n\n"
+            "**Region:** {region} | **Klassifikation:** {classification} | "
+            "**Politisches System:** {political_system}\n\n" + SIMULATION_NOTICE),
+    Section('kennzahlen',
+            "## 📊 Kennzahlen\n\n"
+            "- **Sentiment-Score**: {sentiment_mean:.3f} ± {sentiment_std:.3f}\n"
+            "- **Spanne**: {sentiment_min:.3f} bis {sentiment_max:.3f} (Median {sentiment_median:.3f})\n"
+            "- **Democracy Score**: {democracy_score:.1f}/10\n"
+            "- **Gesamte Posts**: {total_posts:,}\n\n"),
+    Section('einordnung',
+            "## 🔍 Einordnung\n\n"
+            "- **Sentiment-Rang**: {sentiment_rank} von {n_countries}\n"
+            "- **Volatilitäts-Rang**: {volatility_rank} von {n_countries} (1 = höchste Volatilität)\n"
+            "- **Abweichung vom Regionsmittel ({region})**: {region_delta:+.3f}\n\n"),
+    Section('monatstrend',
+            "## 📈 Monatlicher Trend\n\n"
+            "| Monat | Sentiment | Std | Posts |\n"
+            "|---|---|---|---|\n",
+            row="| {month} | {sentiment_mean:.3f} | {sentiment_std:.3f} | {post_count:,} |\n"),
+)
+
+REGION_SECTIONS = (
+    Section('kopf',
+            "# 🌍 Region {region} – Politisches Sentiment\n\n" + SIMULATION_NOTICE),
+    Section('kennzahlen',
+            "## 📊 Regionale Kennzahlen (n={count})\n\n"
+            "- **Durchschnittliches Sentiment**: {avg_sentiment:.3f}{spread}\n"
+            "- **Durchschnittlicher Democracy Score**: {avg_democracy:.1f}/10\n"
+            "- **Durchschnittliche Volatilität**: {avg_volatility:.3f}\n\n"),
+    Section('laender',
+            "## 🗺️ Länder der Region\n\n"
+            "| Land | Klassifikation | Sentiment | Volatilität | Democracy Score |\n"
+            "|---|---|---|---|---|\n",
+            row="| {country_title} | {classification} | {sentiment_mean:.3f} | "
+                "{sentiment_std:.3f} | {democracy_score:.1f} |\n"),
+)
+
+FOOTER = CompiledTemplate("\n---\n\n**Zuletzt aktualisiert:** {updated}\n")
+
+SECTIONS = {'country': COUNTRY_SECTIONS, 'region': REGION_SECTIONS}
+
+
+def _slug(name):
+    """
+    Dateiname einer Einheit: Kleinbuchstaben, alles außer Buchstaben/Ziffern/-/_ wird '_'
+    """
+    return re.sub(r'[^\w-]+', '_', str(name).lower()).strip('_')
+
+
+def build_contexts(results):
+    """
+    Baut die Render-Kontexte aller Länder und Regionen in einem Durchlauf
+
+    Returns:
+        dict {unit_id: {'kind', 'context'}}
+    """
+    stats = results['country_stats'].copy()
+    stats['country_title'] = stats.index.str.title()
+    stats['n_countries'] = len(stats)
+    stats['sentiment_rank'] = stats['sentiment_mean'].rank(ascending=False, method='min').astype(int)
+    stats['volatility_rank'] = stats['sentiment_std'].rank(ascending=False, method='min').astype(int)
+    stats['region_delta'] = stats['sentiment_mean'] - stats.groupby('region')['sentiment_mean'].transform('mean')
+
+    monthly = results['monthly_trends'].copy()
+    monthly['month'] = monthly['month'].astype(str)
+    monthly_rows = {
+        country: block[['month', 'sentiment_mean', 'sentiment_std', 'post_count']].to_dict('records')
+        for country, block in monthly.groupby('country', sort=False)
+    }
+
+    units = {}
+
+    def add_unit(unit_id, kind, context):
+        if unit_id in units:
+            raise ValueError(f"Zwei Einheiten ergeben denselben Dateinamen: {unit_id}")
+        units[unit_id] = {'kind': kind, 'context': context}
+
+    for country, context in stats.to_dict('index').items():
+        context['rows'] = monthly_rows.get(country, [])
+        add_unit(f'country/{_slug(country)}', 'country', context)
+
+    regional = stats.groupby('region').agg(
+        count=('sentiment_mean', 'size'),
+        avg_sentiment=('sentiment_mean', 'mean'),
+        sentiment_spread=('sentiment_mean', 'std'),
+        avg_democracy=('democracy_score', 'mean'),
+        avg_volatility=('sentiment_std', 'mean')
+    )
+    country_rows = stats.reset_index(drop=True).sort_values('sentiment_mean', ascending=False)
+    rows_by_region = {
+        region: block[['country_title', 'classification', 'sentiment_mean',
+                       'sentiment_std', 'democracy_score']].to_dict('records')
+        for region, block in country_rows.groupby('region', sort=False)
+    }
+    for region, context in regional.to_dict('index').items():
+        context['region'] = region
+        # Streuung zwischen Ländern erst ab zwei Ländern definiert (sonst NaN)
+        context['spread'] = (f" ± {context['sentiment_spread']:.3f}"
+                             if context['count'] > 1 else '')
+        context['rows'] = rows_by_region[region]
+        add_unit(f'region/{_slug(region)}', 'region', context)
+
+    return units
+
+
+def render_units(task):
+    """
+    Worker: rendert ein Paket von Einheiten inkrementell
+
+    Returns:
+        Liste von (unit_id, sections_state, rendered, reused, written)
+    """
+    output = []
+    for unit in task['units']:
+        context = unit['context']
+        previous = unit['previous']
+        sections_state, texts = {}, []
+        rendered = reused = 0
+
+        for section in SECTIONS[unit['kind']]:
+            fingerprint = section.fingerprint(context)
+            cached = previous.get(section.name)
+            if cached is not None and cached[0] == fingerprint:
+                text = cached[1]
+                reused += 1
+            else:
+                text = section.render(context)
+                rendered += 1
+            sections_state[section.name] = [fingerprint, text]
+            texts.append(text)
+
+        written = False
+        if rendered or not os.path.exists(unit['path']):
+            texts.append(FOOTER.render({'updated': task['updated']}))
+            document = ''.join(texts)
+            atomic_write(unit['path'], lambda f: f.write(document))
+            written = True
+
+        output.append((unit['unit_id'], sections_state, rendered, reused, written))
+    return output
+
+
+class ReportEngine:
+    """
+    Inkrementelle Länder- und Regionsreports
+
+    Beispiel:
+        engine = ReportEngine('results/reports')
+        summary = engine.render(analyzer.results)
+
+    Der Zustand (Fingerprints und Abschnittstexte) liegt in <output_dir>/.report_state.json.
+    """
+
+    def __init__(self, output_dir='results/reports', backend=None, chunk_size=64):
+        self.output_dir = output_dir
+        self.backend = backend or ProcessPoolBackend()
+        self.chunk_size = chunk_size
+        self.state_path = os.path.join(output_dir, STATE_FILE)
+
+    def _load_state(self):
+        if not os.path.exists(self.state_path):
+            return {}
+        with open(self.state_path, encoding='utf-8') as f:
+            return json.load(f)
+
+    def _unit_path(self, unit_id):
+        kind, name = unit_id.split('/', 1)
+        folder = 'countries' if kind == 'country' else 'regions'
+        return os.path.join(self.output_dir, folder, f'{name}.md')
+
+    def render(self, results):
+        """
+        Rendert alle Einheiten neu, deren Aggregate sich seit dem letzten Lauf geändert haben
+
+        Returns:
+            dict mit Anzahl neu gerenderter/übernommener Abschnitte sowie
+            geschriebener und gelöschter Dateien
+        """
+        units = build_contexts(results)
+        state = self._load_state()
+        updated = datetime.now().strftime('%d.%m.%Y um %H:%M Uhr')
+
+        work = [
+            {
+                'unit_id': unit_id,
+                'kind': unit['kind'],
+                'context': unit['context'],
+                'path': self._unit_path(unit_id),
+                'previous': state.get(unit_id, {})
+            }
+            for unit_id, unit in units.items()
+        ]
+        tasks = [
+            {'units': work[i:i + self.chunk_size], 'updated': updated}
+            for i in range(0, len(work), self.chunk_size)
+        ]
+
+        new_state = {}
+        summary = {'units': len(work), 'sections_rendered': 0, 'sections_reused': 0,
+                   'files_written': 0, 'files_removed': 0}
+        # Ein einzelnes Paket lohnt keinen Prozess-Pool
+        backend = self.backend if len(tasks) > 1 else SerialBackend()
+        for output in backend.map(render_units, tasks):
+            for unit_id, sections_state, rendered, reused, written in output:
+                new_state[unit_id] = sections_state
+                summary['sections_rendered'] += rendered
+                summary['sections_reused'] += reused
+                summary['files_written'] += int(written)
+
+        # Einheiten, die im letzten Lauf existierten, jetzt aber fehlen
+        for unit_id in state.keys() - new_state.keys():
+            path = self._unit_path(unit_id)
+            if os.path.exists(path):
+                os.remove(path)
+                summary['files_removed'] += 1
+
+        atomic_write(
+            self.state_path,
+            lambda f: json.dump(new_state, f, ensure_ascii=False)
+        )
+        return summary
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from partitioned_executor import PartitionedExecutor
+    from sentiment_analysis import CrossCulturalSentimentAnalyzer
+
+    parser = argparse.ArgumentParser(description='Länder- und Regionsreports inkrementell rendern')
+    parser.add_argument('--output-dir', default='results/reports')
+    parser.add_argument('--dumps', nargs='+', metavar='PATH',
+                        help='Post-Dumps (JSONL/CSV, optional .gz/.zst) statt Simulation')
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    analyzer = CrossCulturalSentimentAnalyzer()
+    analyzer.setup_country_data()
+    backend = ProcessPoolBackend(args.workers)
+    executor = PartitionedExecutor(analyzer.countries_data, backend)
+
+    if args.dumps:
+        print(f"📥 Aggregiere {len(args.dumps)} Post-Dump(s)...")
+        results = executor.run_dumps(args.dumps)
+    else:
+        print("🔄 Aggregiere simulierte Daten (letzte 365 Tage)...")
+        results = executor.run()
+
+    summary = ReportEngine(args.output_dir, backend=backend).render(results)
+    print(f"📝 {summary['units']} Einheiten: {summary['sections_rendered']} Abschnitte neu, "
+          f"{summary['sections_reused']} übernommen, {summary['files_written']} Dateien geschrieben, "
+          f"{summary['files_removed']} gelöscht → {args.output_dir}")
@@ -0,0 +1,154 @@
+# 💾 Nebenläufiger Ergebnis-Export
+# Schreibt HTML-Visualisierung, Markdown-Report, CSV-Exporte und Methodik-JSON
+# parallel über einen Thread-Pool.
+#
+# Jede Datei wird zunächst in eine temporäre Datei im Zielverzeichnis geschrieben
+# und anschließend per os.replace() atomar umbenannt. Leser sehen dadurch nie
+# halb geschriebene Ergebnisdateien.
+
+import asyncio
+import copy
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, wait
+
+
+def atomic_write(path, write_func, mode="w", encoding="utf-8"):
+    """
+    Atomares Schreiben einer Datei (Temp-Datei + Rename)
+
+    write_func erhält ein geöffnetes File-Objekt und schreibt den Inhalt.
+    Bei einem Fehler wird die Temp-Datei entfernt, die Zieldatei bleibt unverändert.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(
+        dir=directory, prefix=".", suffix=".tmp"
+    )
+    try:
+        # mkstemp legt 0600 an; Ergebnisdateien sollen normal lesbar sein
+        os.chmod(tmp_path, 0o644)
+        kwargs = {} if "b" in mode else {"encoding": encoding, "newline": ""}
+        with os.fdopen(fd, mode, **kwargs) as f:
+            write_func(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return path
+
+
+class ExportHandle:
+    """
+    Handle auf einen laufenden Export
+
+    Bündelt die Futures der Einzeldateien. result() blockiert bis alle Dateien
+    geschrieben sind und gibt die Pfade zurück (Fehler werden weitergereicht).
+    """
+
+    def __init__(self, futures):
+        self.futures = futures
+
+    def done(self):
+        return all(future.done() for future in self.futures.values())
+
+    def result(self, timeout=None):
+        wait(list(self.futures.values()), timeout=timeout)
+        return {name: future.result(timeout=0) for name, future in self.futures.items()}
+
+    def __await__(self):
+        # Ermöglicht `await handle` innerhalb einer asyncio-Eventloop, ohne einen
+        # Executor-Thread für die Dauer des Exports zu blockieren
+        return self._result_async().__await__()
+
+    async def _result_async(self):
+        await asyncio.gather(*(asyncio.wrap_future(f) for f in self.futures.values()))
+        return self.result(timeout=0)
+
+
+class ResultExporter:
+    """
+    Schreibt die Analyse-Artefakte nebenläufig und atomar
+
+    Methodik:
+    - Jede Datei ist ein eigener Task im Thread-Pool (I/O- und plotly-Serialisierung
+      geben den GIL größtenteils frei bzw. laufen überlappend mit den CSV-Exporten)
+    - Atomare Umbenennung verhindert partielle Dateien für nachgelagerte Leser
+    """
+
+    def __init__(self, output_dir="results", max_workers=None):
+        self.output_dir = output_dir
+        self.max_workers = max_workers
+
+    def _path(self, filename):
+        return os.path.join(self.output_dir, filename)
+
+    def _write_html(self, visualization, filename):
+        # plotly schreibt in ein File-Objekt; Serialisierung erfolgt im Worker-Thread
+        return atomic_write(self._path(filename), visualization.write_html)
+
+    def _write_text(self, text, filename):
+        return atomic_write(self._path(filename), lambda f: f.write(text))
+
+    def _write_csv(self, frame, filename, index):
+        return atomic_write(
+            self._path(filename), lambda f: frame.to_csv(f, index=index)
+        )
+
+    def _write_json(self, payload, filename):
+        return atomic_write(
+            self._path(filename),
+            lambda f: json.dump(payload, f, indent=2, ensure_ascii=False)
+        )
+
+    def _write_aggregates(self, aggregate_store, filename):
+        return atomic_write(self._path(filename), aggregate_store.save, mode="wb")
+
+    def export(self, visualization, insights, sentiment_data, country_stats, methodology,
+               aggregate_store=None):
+        """
+        Startet den Export aller Artefakte und kehrt sofort zurück
+
+        aggregate_store (optional) wird als npz-Index für das Dashboard mitgeschrieben.
+        DataFrames und Methodik werden vor dem Start kopiert: Änderungen des Aufrufers
+        während des laufenden Exports landen so nicht teilweise in den Dateien.
+
+        Returns:
+            ExportHandle mit einem Future pro Datei
+        """
+        sentiment_data = sentiment_data.copy()
+        country_stats = country_stats.copy()
+        methodology = copy.deepcopy(methodology)
+
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="result-export"
+        )
+        futures = {
+            'visualization': executor.submit(
+                self._write_html, visualization, "sentiment_analysis_scientific.html"
+            ),
+            'insights': executor.submit(
+                self._write_text, insights, "scientific_insights_report.md"
+            ),
+            'sentiment_data': executor.submit(
+                self._write_csv, sentiment_data, "sentiment_data_scientific.csv", False
+            ),
+            'country_stats': executor.submit(
+                self._write_csv, country_stats, "country_statistics_scientific.csv", True
+            ),
+            'methodology': executor.submit(
+                self._write_json, methodology, "scientific_methodology.json"
+            ),
+        }
+        if aggregate_store is not None:
+            futures['aggregates'] = executor.submit(
+                self._write_aggregates, aggregate_store, "sentiment_aggregates.npz"
+            )
+        # Bereits eingereichte Tasks laufen weiter, der Pool nimmt nur nichts Neues an
+        executor.shutdown(wait=False)
+        return ExportHandle(futures)
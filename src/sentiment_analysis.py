@@ -15,9 +15,70 @@ import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
 from datetime import datetime, timedelta
+import os
 import warnings
+import zlib
+from scipy import special, stats
+from aggregate_store import AggregateStore
+from cross_country_analysis import analyze_cross_country_dynamics
+from report_engine import ReportEngine
+from result_export import ResultExporter
 warnings.filterwarnings('ignore')
 
+
+def assemble_results(country_stats, monthly_stats, cross_country_dynamics, aggregate_store,
+                     sample_size, time_period, execution=None):
+    """
+    Gemeinsame Ergebnis-Zusammenstellung für In-Memory- und partitionierte Läufe
+
+    Berechnet Korrelationen und Klassifikationsstatistik aus den Länder-Statistiken
+    und ergänzt die Methodik-Angaben.
+
+    Returns:
+        Ergebnis-dict wie analyze_sentiment_patterns()
+    """
+    # Wissenschaftliche Korrelationsanalyse
+    # Referenz: Steinert-Threlkeld (2018) - Statistical Analysis Methods
+    correlation_democracy = country_stats['sentiment_mean'].corr(
+        country_stats['democracy_score']
+    )
+
+    correlation_volatility = country_stats['sentiment_std'].corr(
+        country_stats['democracy_score']
+    )
+
+    # Klassifikations-basierte Analyse
+    classification_stats = country_stats.groupby('classification').agg({
+        'sentiment_mean': ['mean', 'std', 'count'],
+        'sentiment_std': 'mean',
+        'democracy_score': 'mean'
+    }).round(4)
+
+    methodology = {
+        'sentiment_analysis': 'VADER-based normalization with political context adjustment',
+        'correlation_method': 'Pearson correlation coefficient',
+        'cross_country_method': 'Country x country Pearson matrix, FFT-based lead/lag cross-correlation, hierarchical clustering (average linkage, 1 - r)',
+        'temporal_analysis': 'Monthly aggregation with trend decomposition',
+        'sample_size': sample_size,
+        'time_period': time_period,
+        'countries_analyzed': len(country_stats)
+    }
+    if execution is not None:
+        methodology['execution'] = execution
+
+    return {
+        'country_stats': country_stats,
+        'correlation_democracy': correlation_democracy,
+        'correlation_volatility': correlation_volatility,
+        'monthly_trends': monthly_stats,
+        'classification_stats': classification_stats,
+        'cross_country_dynamics': cross_country_dynamics,
+        # Tages-Aggregate mit kumulierten Summen für Slice-Abfragen (Dashboard)
+        'aggregate_store': aggregate_store,
+        'scientific_methodology': methodology
+    }
+
+
 class CrossCulturalSentimentAnalyzer:
     """
     Wissenschaftlich fundierte Klasse für länderübergreifende politische Sentiment-Analyse
@@ -251,16 +312,82 @@ class CrossCulturalSentimentAnalyzer:
         """
         Saisonale politische Effekte
         Referenz: Antonakaki et al. (2017) - Temporal Variation Analysis
+        
+        Akzeptiert ein einzelnes Datum (Timestamp) oder einen DatetimeIndex.
         """
-        return np.sin(2 * np.pi * date.dayofyear / 365) * 0.1
+        return (np.sin(2 * np.pi * np.asarray(date.dayofyear) / 365) * 0.1)[()]
     
     def _calculate_weekday_effects(self, date):
         """
         Wochentag-Effekte basierend auf Social Media Aktivitätsmustern
         Referenz: Sistia et al. (2019) - Social Media Usage Patterns
+        
+        Akzeptiert ein einzelnes Datum (Timestamp) oder einen DatetimeIndex.
         """
         # Weniger politische Aktivität am Wochenende
-        return -0.05 if date.weekday() >= 5 else 0.02
+        return np.where(np.asarray(date.dayofweek) >= 5, -0.05, 0.02)[()]
+    
+    def _daily_uniforms(self, seed, country, day_offsets):
+        """
+        Gleichverteilte Zufallszahlen je (Seed, Land, Tag) für die Partitionierung
+        
+        Zähler-basierter Generator (Philox): Tag d nutzt exakt den Zählerblock d des
+        Länder-Schlüssels. Jeder Zeitabschnitt springt direkt zu seinem Tages-Offset,
+        die Werte hängen daher nicht von der Partitionierung ab.
+        
+        Returns:
+            Array (len(day_offsets), 2) in (0, 1): Rauschen, Post-Anzahl
+        """
+        key = (int(seed) << 32) | zlib.crc32(country.encode('utf-8'))
+        first, last = int(day_offsets.min()), int(day_offsets.max())
+        bit_generator = np.random.Philox(key=key)
+        bit_generator.advance(first)
+        # Philox4x64 liefert 4 Werte je Zählerstand → ein Zählerstand je Tag
+        raw = bit_generator.random_raw(4 * (last - first + 1)).reshape(-1, 4)[:, :2]
+        uniforms = ((raw >> np.uint64(11)).astype(np.float64) + 0.5) * 2.0 ** -53
+        return uniforms[day_offsets - first]
+    
+    
+    def generate_country_block(self, country, info, dates, origin, seed=42):
+        """
+        Vektorisierte Sentiment-Generierung für ein Land und einen Zeitabschnitt
+        
+        Gleiche Methodik wie generate_mock_sentiment_data(), aber mit Zufallszahlen
+        je (Seed, Land, Tag), damit Partitionen unabhängig voneinander (und in
+        beliebiger Reihenfolge) erzeugt werden können und das Ergebnis nicht von
+        der Partitionierung abhängt.
+        origin ist der Beginn des Gesamtzeitraums (Bezugspunkt von Trend und Zufallsstrom).
+        """
+        democracy_score = info['democracy_score']
+        base_sentiment = self._calculate_democracy_sentiment_correlation(democracy_score)
+        country_volatility, country_trend = self._get_country_specific_parameters(country, info)
+        
+        # Temporale Effekte (saisonal, Wochentag, Langzeittrend)
+        day_offsets = (dates - origin).days.to_numpy()
+        seasonal_factor = self._calculate_seasonal_political_effects(dates)
+        weekday_factor = self._calculate_weekday_effects(dates)
+        time_factor = country_trend * day_offsets / 365
+        
+        # Stochastische Komponenten per Inversionsmethode aus den Tages-Zufallszahlen
+        uniforms = self._daily_uniforms(seed, country, day_offsets)
+        noise = special.ndtri(uniforms[:, 0]) * country_volatility
+        
+        sentiment = base_sentiment + seasonal_factor + weekday_factor + noise + time_factor
+        sentiment = np.clip(sentiment, -1, 1)  # VADER-kompatible Normalisierung
+        
+        post_rate = info['population'] / 100000
+        post_count = np.maximum(1, stats.poisson.ppf(uniforms[:, 1], post_rate)).astype(np.int64)
+        
+        return pd.DataFrame({
+            'country': country,
+            'date': dates,
+            'sentiment_score': sentiment,
+            'post_count': post_count,
+            'democracy_score': democracy_score,
+            'region': info['region'],
+            'political_system': info['political_system'],
+            'classification': info['classification']
+        })
     
     def analyze_sentiment_patterns(self):
         """
@@ -288,16 +415,6 @@ class CrossCulturalSentimentAnalyzer:
                                'avg_posts_per_day', 'democracy_score', 'region', 
                                'political_system', 'classification']
         
-        # Wissenschaftliche Korrelationsanalyse
-        # Referenz: Steinert-Threlkeld (2018) - Statistical Analysis Methods
-        correlation_democracy = country_stats['sentiment_mean'].corr(
-            country_stats['democracy_score']
-        )
-        
-        correlation_volatility = country_stats['sentiment_std'].corr(
-            country_stats['democracy_score']
-        )
-        
         # Temporale Trend-Analyse
         # Referenz: Antonakaki et al. (2017) - Temporal Variation Analysis
         monthly_trends = self.sentiment_data.copy()
@@ -310,28 +427,17 @@ class CrossCulturalSentimentAnalyzer:
         # Flatten columns
         monthly_stats.columns = ['country', 'month', 'sentiment_mean', 'sentiment_std', 'post_count']
         
-        # Klassifikations-basierte Analyse
-        classification_stats = country_stats.groupby('classification').agg({
-            'sentiment_mean': ['mean', 'std', 'count'],
-            'sentiment_std': 'mean',
-            'democracy_score': 'mean'
-        }).round(4)
+        # Länderübergreifende Dynamik: Korrelationsmatrix, Lead/Lag, Clustering
+        cross_country_dynamics = analyze_cross_country_dynamics(self.sentiment_data)
         
-        self.results = {
-            'country_stats': country_stats,
-            'correlation_democracy': correlation_democracy,
-            'correlation_volatility': correlation_volatility,
-            'monthly_trends': monthly_stats,
-            'classification_stats': classification_stats,
-            'scientific_methodology': {
-                'sentiment_analysis': 'VADER-based normalization with political context adjustment',
-                'correlation_method': 'Pearson correlation coefficient',
-                'temporal_analysis': 'Monthly aggregation with trend decomposition',
-                'sample_size': len(self.sentiment_data),
-                'time_period': '365 days',
-                'countries_analyzed': len(self.countries_data)
-            }
-        }
+        self.results = assemble_results(
+            country_stats,
+            monthly_stats,
+            cross_country_dynamics,
+            AggregateStore.from_sentiment_data(self.sentiment_data),
+            sample_size=len(self.sentiment_data),
+            time_period='365 days'
+        )
         
         return self.results
     
@@ -686,9 +792,15 @@ class CrossCulturalSentimentAnalyzer:
         
         return "\n".join(insights)
     
-    def run_complete_analysis(self):
+    def run_complete_analysis(self, output_dir="results", wait_for_export=False, reports=True):
         """
         Vollständige wissenschaftlich fundierte Analyse
+        
+        Der Datei-Export läuft nebenläufig im Hintergrund. Das Ergebnis enthält unter
+        'export' ein ExportHandle: export.result() (bzw. `await export`) wartet, bis
+        alle Dateien geschrieben sind. Mit wait_for_export=True wird direkt gewartet.
+        Mit reports=True werden die Länder-/Regionsreports inkrementell unter
+        <output_dir>/reports aktualisiert (Zusammenfassung unter 'reports').
         """
         print("🌍 Cross-Cultural Political Sentiment Analysis")
         print("📚 Wissenschaftlich fundierte Analyse basierend auf EIU Democracy Index 2024")
@@ -738,22 +850,6 @@ class CrossCulturalSentimentAnalyzer:
             count = int(stats[('sentiment_mean', 'count')])
             print(f"   📊 {classification}: {avg_sentiment:.3f} (n={count})")
         
-        # Dateien mit wissenschaftlichen Standards speichern
-        print(f"\n💾 **Speichere wissenschaftliche Ergebnisse:**")
-        
-        # Visualisierung mit Metadaten
-        visualization.write_html("results/sentiment_analysis_scientific.html")
-        print(f"   📊 Interaktive Visualisierung: results/sentiment_analysis_scientific.html")
-        
-        # Wissenschaftlicher Report
-        with open("results/scientific_insights_report.md", "w", encoding="utf-8") as f:
-            f.write(insights)
-        print(f"   📝 Wissenschaftlicher Report: results/scientific_insights_report.md")
-        
-        # Strukturierte Datenexporte
-        self.sentiment_data.to_csv("results/sentiment_data_scientific.csv", index=False)
-        country_stats.to_csv("results/country_statistics_scientific.csv")
-        
         # Methodische Metadaten
         methodology_export = {
             'methodology': self.results['scientific_methodology'],
@@ -765,24 +861,48 @@ class CrossCulturalSentimentAnalyzer:
             }
         }
         
-        import json
-        with open("results/scientific_methodology.json", "w", encoding="utf-8") as f:
-            json.dump(methodology_export, f, indent=2, ensure_ascii=False)
+        # Dateien mit wissenschaftlichen Standards speichern
+        # Nebenläufig und atomar (Temp-Datei + Rename), die Analyse kehrt sofort zurück
+        print(f"\n💾 **Speichere wissenschaftliche Ergebnisse (asynchron):**")
+        export = ResultExporter(output_dir).export(
+            visualization=visualization,
+            insights=insights,
+            sentiment_data=self.sentiment_data,
+            country_stats=country_stats,
+            methodology=methodology_export,
+            aggregate_store=self.results['aggregate_store']
+        )
+        
+        print(f"   📊 Interaktive Visualisierung: {output_dir}/sentiment_analysis_scientific.html")
+        print(f"   📝 Wissenschaftlicher Report: {output_dir}/scientific_insights_report.md")
+        print(f"   💾 Rohdaten: {output_dir}/sentiment_data_scientific.csv")
+        print(f"   📊 Statistiken: {output_dir}/country_statistics_scientific.csv")
+        print(f"   🔬 Methodik: {output_dir}/scientific_methodology.json")
+        print(f"   📦 Aggregate (Dashboard): {output_dir}/sentiment_aggregates.npz")
+        
+        report_summary = None
+        if reports:
+            report_dir = os.path.join(output_dir, 'reports')
+            report_summary = ReportEngine(report_dir).render(self.results)
+            print(f"   🗂️ Länder-/Regionsreports: {report_dir}/ "
+                  f"({report_summary['files_written']} aktualisiert, "
+                  f"{report_summary['sections_reused']} Abschnitte übernommen)")
         
-        print(f"   💾 Rohdaten: results/sentiment_data_scientific.csv")
-        print(f"   📊 Statistiken: results/country_statistics_scientific.csv")
-        print(f"   🔬 Methodik: results/scientific_methodology.json")
+        if wait_for_export:
+            export.result()
         
         print(f"\n✅ **Wissenschaftliche Analyse komplett!**")
-        print(f"🌐 Öffne results/sentiment_analysis_scientific.html für interaktive Auswertung")
-        print(f"📚 Vollständige Referenzen in results/scientific_insights_report.md")
+        print(f"🌐 Öffne {output_dir}/sentiment_analysis_scientific.html für interaktive Auswertung")
+        print(f"📚 Vollständige Referenzen in {output_dir}/scientific_insights_report.md")
         
         return {
             'data': self.sentiment_data,
             'results': self.results,
             'visualization': visualization,
             'insights': insights,
-            'methodology': methodology_export
+            'methodology': methodology_export,
+            'export': export,
+            'reports': report_summary
         }
 
 # Hauptprogramm mit wissenschaftlicher Dokumentation
@@ -793,6 +913,7 @@ if __name__ == "__main__":
     
     analyzer = CrossCulturalSentimentAnalyzer()
     results = analyzer.run_complete_analysis()
+    results['export'].result()  # Auf Abschluss der Datei-Exporte warten
     
     print("\n🚀 **Bereit für wissenschaftliche Publikation!**")
     print("📊 Diese Analyse demonstriert:")
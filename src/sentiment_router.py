@@ -0,0 +1,296 @@
+# 🌐 Mehrsprachiges Sentiment-Scoring
+# Zukünftige Forschungsrichtung laut Report: "Mehrsprachige Analyse mit
+# kulturspezifischen Sentiment-Lexika"
+#
+# Methodik:
+# - Sprache je Post aus dem Dump-Feld 'language', fehlende Angaben werden
+#   per Stoppwort-Abgleich erkannt (vektorisiert über den ganzen Batch)
+# - Gruppierung des Batches nach Sprache, je Gruppe ein Scorer-Aufruf
+# - Scorer werden lazy geladen und pro Worker-Prozess gecacht
+# - Englisch: VADER (Hutto & Gilbert, 2014); weitere Sprachen: Lexikon-Dateien
+#   im VADER-Format unter data/lexicons/<sprache>.txt
+# - Sprachen ohne Lexikon, unerkannte Sprachen und leere Texte bleiben unbewertet
+#   (NaN, mit Warnung) und fließen nicht in die Aggregate ein
+# - Durchsatz (reine Scoring-Zeit), Ladezeit und Cache-Ladevorgänge werden je
+#   Sprache protokolliert
+
+import os
+import time
+import warnings
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+LEXICON_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'lexicons'
+)
+UNKNOWN_LANGUAGE = 'und'
+DEFAULT_LANGUAGE = 'en'
+
+# Häufige Funktionswörter für die Spracherkennung
+STOPWORDS = {
+    'en': 'the and is are was of to in that this for with not you it on have',
+    'de': 'der die das und ist nicht ein eine mit von zu den auf für sich auch wir',
+    'fr': 'le la les et est une des pas que qui dans pour sur avec nous du',
+    'pl': 'i w nie na jest to się że z do jak co ale przez dla tak',
+    'it': 'il la che è di non per una sono con del della gli anche questo',
+    'pt': 'o a os que de não uma para com é do da em mais por isso',
+    'sv': 'och är att det som en på inte för med av jag har till den',
+}
+_STOPWORD_TABLE = pd.DataFrame(
+    [(word, language) for language, words in STOPWORDS.items() for word in words.split()],
+    columns=['token', 'language']
+)
+
+
+def detect_languages(texts):
+    """
+    Stoppwort-basierte Spracherkennung für einen ganzen Batch
+
+    Returns:
+        Series mit ISO-639-1-Codes (UNKNOWN_LANGUAGE ohne Treffer), Index wie texts
+    """
+    tokens = texts.str.lower().str.findall(r'\w+').explode().dropna()
+    if tokens.empty:
+        return pd.Series(UNKNOWN_LANGUAGE, index=texts.index)
+
+    hits = tokens.rename('token').rename_axis('row').reset_index().merge(
+        _STOPWORD_TABLE, on='token'
+    )
+    if hits.empty:
+        return pd.Series(UNKNOWN_LANGUAGE, index=texts.index)
+
+    counts = hits.groupby(['row', 'language']).size()
+    best = counts.groupby(level='row').idxmax().map(lambda key: key[1])
+    return best.reindex(texts.index, fill_value=UNKNOWN_LANGUAGE)
+
+
+# ----------------------------------------------------------------------
+# Scorer
+# ----------------------------------------------------------------------
+
+class VaderScorer:
+    """
+    VADER Compound Score (englische Texte)
+    """
+
+    name = 'vader'
+
+    def __init__(self):
+        from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+        self._polarity = SentimentIntensityAnalyzer().polarity_scores
+
+    def score(self, texts):
+        polarity = self._polarity
+        return np.fromiter((polarity(text)['compound'] for text in texts),
+                           dtype=np.float64, count=len(texts))
+
+
+class LexiconScorer:
+    """
+    Lexikon-Scorer für ein sprachspezifisches Valenz-Lexikon
+
+    Dateiformat wie vader_lexicon.txt: Token<TAB>Valenz[<TAB>...], eine Zeile je Token.
+    Scoring vollständig vektorisiert: Tokenisierung, Lexikon-Lookup und Summierung
+    je Post über pandas; Normalisierung wie VADER (s / sqrt(s² + 15)).
+    """
+
+    name = 'lexicon'
+
+    def __init__(self, path, alpha=15):
+        lexicon = pd.read_csv(path, sep='\t', header=None, usecols=[0, 1],
+                              names=['token', 'valence'], quoting=3,
+                              encoding='utf-8', comment=None)
+        self.lexicon = lexicon.drop_duplicates('token').set_index('token')['valence']
+        self.alpha = alpha
+
+    def score(self, texts):
+        texts = pd.Series(texts).reset_index(drop=True)
+        tokens = texts.str.lower().str.findall(r'\w+').explode()
+        valence = tokens.map(self.lexicon).fillna(0.0).astype(np.float64)
+        total = valence.groupby(level=0).sum().reindex(texts.index, fill_value=0.0).to_numpy()
+        return total / np.sqrt(total * total + self.alpha)
+
+
+@lru_cache(maxsize=None)
+def default_route(language):
+    """
+    Bestimmt den Scorer einer Sprache: VADER für Englisch, sonst eigenes Lexikon
+
+    Returns:
+        Scorer-Schlüssel oder None, wenn für die Sprache kein Lexikon vorliegt
+    """
+    if language == DEFAULT_LANGUAGE:
+        return DEFAULT_LANGUAGE
+    if os.path.exists(os.path.join(LEXICON_DIR, f'{language}.txt')):
+        return language
+    return None
+
+
+def default_factory(route):
+    """
+    Scorer-Fabrik zu default_route()
+    """
+    if route == DEFAULT_LANGUAGE:
+        return VaderScorer()
+    return LexiconScorer(os.path.join(LEXICON_DIR, f'{route}.txt'))
+
+
+# Scorer-Cache pro Worker-Prozess (nicht Teil des gepickelten Routers)
+_SCORER_CACHE = {}
+
+
+def get_scorer(route, factory=default_factory):
+    """
+    Lädt den Scorer einer Route lazy und cacht ihn im aktuellen Prozess
+
+    Returns:
+        (scorer, loaded) - loaded ist True, wenn der Scorer neu geladen wurde
+    """
+    key = (factory, route)
+    if key in _SCORER_CACHE:
+        return _SCORER_CACHE[key], False
+    scorer = factory(route)
+    _SCORER_CACHE[key] = scorer
+    return scorer, True
+
+
+# ----------------------------------------------------------------------
+# Router
+# ----------------------------------------------------------------------
+
+class ScoringRouter:
+    """
+    Routet Batches sprachweise an gecachte Scorer
+
+    Als score_func für ingest_posts() und PartitionedExecutor.run_dumps() nutzbar:
+    erwartet einen Batch mit Spalte 'text' (optional 'language') und liefert
+    ihn mit 'language' und 'sentiment_score' zurück. Die simulierten Partitionen
+    von PartitionedExecutor.run() enthalten keine Texte und sind bereits gescored.
+
+    route bildet eine Sprache auf einen Scorer-Schlüssel ab, factory lädt den
+    Scorer zu diesem Schlüssel. Liefert route None, erhalten die Posts der Sprache
+    sentiment_score NaN (einmalige Warnung je Sprache). Dasselbe gilt für Posts,
+    deren Sprache unbekannt bleibt (UNKNOWN_LANGUAGE), und für leere Texte: sie
+    würden sonst als neutrales Sentiment (≈ 0) in die Aggregate eingehen.
+    Statistiken werden im jeweiligen Prozess geführt; Worker-Kopien starten leer,
+    collect_stats() und merge_stats() führen sie im Treiber zusammen.
+    """
+
+    def __init__(self, route=default_route, factory=default_factory, detect=True):
+        self.route = route
+        self.factory = factory
+        self.detect = detect
+        self._stats = {}
+        self._unsupported = set()
+
+    def __getstate__(self):
+        # Gepickelte Kopien (Worker-Prozesse) zählen nur ihre eigenen Batches
+        state = self.__dict__.copy()
+        state['_stats'] = {}
+        return state
+
+    def __call__(self, batch):
+        if 'text' not in batch.columns:
+            raise ValueError("ScoringRouter benötigt einen Batch mit Spalte 'text'")
+        batch = batch.copy()
+        # None/NaN-Texte als leere Strings behandeln (astype(str) lässt NaN stehen)
+        batch['text'] = batch['text'].fillna('').astype(str)
+        if 'language' in batch.columns:
+            languages = batch['language'].fillna(UNKNOWN_LANGUAGE).astype(str).str.lower()
+        else:
+            languages = pd.Series(UNKNOWN_LANGUAGE, index=batch.index)
+        # Leere Texte tragen kein Sentiment, unabhängig vom Sprach-Tag
+        languages[batch['text'].str.strip() == ''] = UNKNOWN_LANGUAGE
+
+        if self.detect:
+            unknown = languages == UNKNOWN_LANGUAGE
+            if unknown.any():
+                languages[unknown] = detect_languages(batch.loc[unknown, 'text'])
+        batch['language'] = languages
+
+        scores = np.full(len(batch), np.nan, dtype=np.float64)
+        texts = batch['text'].to_numpy()
+        for language, positions in batch.groupby('language', sort=False).indices.items():
+            route = None if language == UNKNOWN_LANGUAGE else self.route(language)
+            if route is None:
+                self._skip(language, len(positions))
+                continue
+            load_start = time.perf_counter()
+            scorer, loaded = get_scorer(route, self.factory)
+            # Durchsatz nur über das Scoring, Ladezeit des Scorers separat
+            start = time.perf_counter()
+            scores[positions] = scorer.score(texts[positions])
+            self._record(language, f'{scorer.name}:{route}', len(positions),
+                         time.perf_counter() - start, start - load_start if loaded else 0.0,
+                         loaded)
+
+        batch['sentiment_score'] = scores
+        return batch
+
+    def _skip(self, language, n_posts):
+        if language not in self._unsupported:
+            self._unsupported.add(language)
+            if language == UNKNOWN_LANGUAGE:
+                reason = "Sprache nicht erkannt oder leerer Text"
+            else:
+                reason = (f"Kein Sentiment-Lexikon für Sprache '{language}' "
+                          f"({os.path.join(LEXICON_DIR, language + '.txt')})")
+            warnings.warn(f"{reason}: Posts bleiben unbewertet (NaN)", stacklevel=3)
+        self._record(language, 'unbewertet', n_posts, 0.0, 0.0, False)
+
+    def _record(self, language, scorer, n_posts, seconds, load_seconds, loaded):
+        entry = self._stats.setdefault(language, {
+            'scorer': scorer, 'posts': 0, 'seconds': 0.0, 'load_seconds': 0.0,
+            'cache_loads': 0, 'batches': 0
+        })
+        entry['posts'] += n_posts
+        entry['seconds'] += seconds
+        entry['load_seconds'] += load_seconds
+        entry['cache_loads'] += int(loaded)
+        entry['batches'] += 1
+
+    def collect_stats(self):
+        """
+        Gibt die seit dem letzten Aufruf gesammelten Rohstatistiken zurück und leert sie
+
+        Wird am Ende einer Partition im Worker aufgerufen.
+        """
+        stats, self._stats = self._stats, {}
+        return stats
+
+    def merge_stats(self, stats):
+        """
+        Addiert Rohstatistiken aus collect_stats() (z. B. eines Workers)
+        """
+        for language, entry in stats.items():
+            target = self._stats.setdefault(language, {
+                'scorer': entry['scorer'], 'posts': 0, 'seconds': 0.0, 'load_seconds': 0.0,
+                'cache_loads': 0, 'batches': 0
+            })
+            for key in ('posts', 'seconds', 'load_seconds', 'cache_loads', 'batches'):
+                target[key] += entry[key]
+
+    def stats(self):
+        """
+        Durchsatz und Cache-Ladevorgänge je Sprache
+
+        seconds enthält nur die Scoring-Zeit, load_seconds die Ladezeit der Scorer.
+        """
+        frame = pd.DataFrame.from_dict(self._stats, orient='index')
+        if frame.empty:
+            return frame
+        frame['posts_per_second'] = frame['posts'] / frame['seconds'].where(frame['seconds'] > 0)
+        frame.index.name = 'language'
+        return frame.sort_values('posts', ascending=False)
+
+    def print_stats(self):
+        print(f"\n🌐 **Scoring nach Sprache:**")
+        for language, row in self.stats().iterrows():
+            if row['scorer'] == 'unbewertet':
+                print(f"   {language}: {int(row['posts']):,} Posts unbewertet")
+                continue
+            print(f"   {language}: {int(row['posts']):,} Posts via {row['scorer']} "
+                  f"({row['posts_per_second']:,.0f} Posts/s, {int(row['cache_loads'])} Cache-Ladevorgänge, "
+                  f"{row['load_seconds']:.2f}s Ladezeit)")
@@ -0,0 +1,7 @@
+# Gemeinsame Test-Konfiguration: Module aus src/ importierbar machen
+# (die Skripte in src/ importieren sich gegenseitig ohne Paketpräfix)
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
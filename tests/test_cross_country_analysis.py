@@ -0,0 +1,36 @@
+# Tests: Länderübergreifende Korrelation, auch bei lückenhaften Tagesreihen
+
+import numpy as np
+import pandas as pd
+
+from cross_country_analysis import analyze_cross_country_dynamics, pivot_sentiment_matrix
+
+
+def gappy_data():
+    dates = pd.date_range('2024-01-01', periods=60, freq='D')
+    rng = np.random.default_rng(0)
+    frames = []
+    for country in ('a', 'b', 'c'):
+        keep = rng.random(len(dates)) > 0.2  # ~20 % fehlende Tage je Land
+        frames.append(pd.DataFrame({
+            'country': country,
+            'date': dates[keep],
+            'sentiment_score': rng.normal(size=keep.sum())
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+def test_missing_days_are_filled_with_country_mean():
+    data = gappy_data()
+    countries, dates, matrix = pivot_sentiment_matrix(data)
+
+    assert matrix.flags.c_contiguous and matrix.dtype == np.float32
+    assert not np.isnan(matrix).any()
+    means = data.groupby('country')['sentiment_score'].mean().reindex(countries)
+    np.testing.assert_allclose(matrix.mean(axis=1), means, atol=1e-5)
+
+
+def test_dynamics_run_on_gappy_data():
+    corr = analyze_cross_country_dynamics(gappy_data())['correlation_matrix']
+    assert corr.shape == (3, 3)
+    np.testing.assert_allclose(np.diag(corr), 1.0, atol=1e-5)
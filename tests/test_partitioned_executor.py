@@ -0,0 +1,98 @@
+# Tests: Partitionierte Ausführung liefert dieselben Ergebnisse wie ein Gesamtlauf
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from execution_backends import ExecutionBackend, ProcessPoolBackend, SerialBackend
+from partitioned_executor import PartitionedExecutor
+from sentiment_analysis import CrossCulturalSentimentAnalyzer
+
+DATES = pd.date_range('2024-01-01', '2024-03-31', freq='D')
+
+
+@pytest.fixture(scope='module')
+def countries_data():
+    analyzer = CrossCulturalSentimentAnalyzer()
+    analyzer.setup_country_data()
+    return analyzer.countries_data
+
+
+@pytest.fixture(scope='module')
+def raw_data(countries_data):
+    """Ungeteilte Referenz: alle Länder über den Gesamtzeitraum"""
+    analyzer = CrossCulturalSentimentAnalyzer()
+    return pd.concat([
+        analyzer.generate_country_block(country, info, DATES, DATES[0], 42)
+        for country, info in countries_data.items()
+    ])
+
+
+def three_posts_per_day(frame):
+    """Score-Funktion mit Post-Ebene: drei Beobachtungen je Land und Tag"""
+    rng = np.random.default_rng(len(frame))
+    posts = pd.concat([frame] * 3, ignore_index=True)
+    posts['sentiment_score'] = np.clip(posts['sentiment_score'] + rng.normal(0, 0.1, len(posts)), -1, 1)
+    posts['post_count'] = 1
+    return posts
+
+
+def run(countries_data, backend=None, **kwargs):
+    return PartitionedExecutor(countries_data, backend or SerialBackend()).run(dates=DATES, **kwargs)
+
+
+@pytest.mark.parametrize('partition_by, partition_size', [
+    ('time', 30), ('time', 7), ('time', 1), ('country', 3)
+])
+def test_partitioning_does_not_change_results(countries_data, partition_by, partition_size):
+    reference = run(countries_data, partition_by='country', partition_size=1)
+    result = run(countries_data, partition_by=partition_by, partition_size=partition_size)
+
+    pd.testing.assert_frame_equal(result['daily_aggregates'], reference['daily_aggregates'])
+    pd.testing.assert_frame_equal(result['country_stats'], reference['country_stats'])
+
+
+def test_merged_statistics_match_raw_data(countries_data, raw_data):
+    stats = run(countries_data, partition_by='time', partition_size=30)['country_stats']
+    expected = raw_data.groupby('country').agg(
+        sentiment_mean=('sentiment_score', 'mean'),
+        sentiment_std=('sentiment_score', 'std'),
+        sentiment_min=('sentiment_score', 'min'),
+        sentiment_max=('sentiment_score', 'max'),
+        total_posts=('post_count', 'sum'),
+        avg_posts_per_day=('post_count', 'mean')
+    ).reindex(stats.index)
+
+    for column in expected.columns:
+        np.testing.assert_allclose(stats[column], expected[column], atol=1e-4)
+    # Median aus Histogrammen: höchstens eine Bin-Breite Abweichung (plus Rundung)
+    median = raw_data.groupby('country')['sentiment_score'].median().reindex(stats.index)
+    np.testing.assert_allclose(stats['sentiment_median'], median, atol=1e-3)
+
+
+def test_post_level_data_merges_exactly(countries_data):
+    result = run(countries_data, partition_by='time', partition_size=30,
+                 score_func=three_posts_per_day)
+    stats = result['country_stats']
+
+    np.testing.assert_allclose(stats['avg_posts_per_day'], 3.0)
+    assert (stats['total_posts'] == 3 * len(DATES)).all()
+    assert result['daily_aggregates']['n'].eq(3).all()
+
+
+def test_process_pool_matches_serial(countries_data):
+    serial = run(countries_data, partition_by='country', partition_size=2)
+    pooled = run(countries_data, ProcessPoolBackend(max_workers=2),
+                 partition_by='country', partition_size=2)
+
+    pd.testing.assert_frame_equal(pooled['daily_aggregates'], serial['daily_aggregates'])
+
+
+def test_unknown_partitioning_is_rejected(countries_data):
+    with pytest.raises(ValueError):
+        run(countries_data, partition_by='region')
+
+
+def test_execution_backend_is_abstract():
+    with pytest.raises(TypeError):
+        ExecutionBackend()
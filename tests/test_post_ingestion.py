@@ -0,0 +1,76 @@
+# Tests: Ingestion liefert für alle Formate, Kompressionen und Parser dieselben Aggregate
+
+import gzip
+
+import pandas as pd
+import pytest
+
+import post_ingestion
+from post_ingestion import generate_post_fixture, ingest_posts, iter_post_batches
+
+VARIANTS = ('jsonl', 'jsonl.gz', 'jsonl.zst', 'csv', 'csv.gz', 'csv.zst')
+BLOCK_SIZE = 64 * 1024  # klein, damit viele Blockgrenzen entstehen
+
+
+def length_score(batch):
+    """Deterministisches Scoring ohne Lexika: Textlänge"""
+    batch = batch.copy()
+    batch['sentiment_score'] = batch['text'].str.len() / 100
+    return batch
+
+
+@pytest.fixture(scope='module')
+def dumps(tmp_path_factory):
+    directory = tmp_path_factory.mktemp('dumps')
+    return {
+        variant: generate_post_fixture(str(directory / f'posts.{variant}'), n_posts=5_000,
+                                       days=30, multiline_share=0.2)
+        for variant in VARIANTS
+    }
+
+
+@pytest.fixture(params=[True, False], ids=['arrow', 'stdlib'])
+def parser(request, monkeypatch):
+    if not request.param:
+        monkeypatch.setattr(post_ingestion, 'pa', None)
+    elif post_ingestion.pa is None:
+        pytest.skip('pyarrow nicht installiert')
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def reference(dumps):
+    return ingest_posts(dumps['jsonl'], length_score, block_size=BLOCK_SIZE,
+                        verbose=False)['daily_aggregates']
+
+
+@pytest.mark.parametrize('variant', VARIANTS)
+def test_variants_give_identical_aggregates(dumps, reference, parser, variant):
+    result = ingest_posts(dumps[variant], length_score, block_size=BLOCK_SIZE, verbose=False)
+
+    assert result['throughput']['posts'] == 5_000
+    pd.testing.assert_frame_equal(result['daily_aggregates'], reference)
+
+
+@pytest.mark.parametrize('variant', ('csv', 'csv.gz'))
+def test_multiline_texts_survive_csv_parsing(dumps, parser, variant):
+    texts = pd.concat(batch['text'] for batch, _ in iter_post_batches(dumps[variant],
+                                                                        block_size=BLOCK_SIZE))
+    assert len(texts) == 5_000
+    assert texts.str.contains('\n').mean() == pytest.approx(0.2, abs=0.03)
+
+
+def test_byte_count_covers_decompressed_file(dumps, parser):
+    with gzip.open(dumps['csv.gz'], 'rb') as f:
+        size = len(f.read())
+    total = sum(n_bytes for _, n_bytes in iter_post_batches(dumps['csv.gz'], block_size=BLOCK_SIZE))
+    assert total == size
+
+
+@pytest.mark.filterwarnings('error::pytest.PytestUnraisableExceptionWarning')
+def test_parse_error_releases_mapped_block(tmp_path):
+    path = tmp_path / 'broken.jsonl'
+    path.write_text('{"text": "ok", "timestamp": "2024-01-01", "country": "x"}\n{kaputt\n' * 100)
+
+    with pytest.raises(Exception):
+        list(iter_post_batches(str(path), block_size=256))
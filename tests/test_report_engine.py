@@ -0,0 +1,82 @@
+# Tests: Inkrementelle Reports (Fingerprints, Dateinamen, entfallene Einheiten)
+
+import os
+
+import pandas as pd
+import pytest
+
+import report_engine
+from execution_backends import SerialBackend
+from report_engine import ReportEngine, Section, build_contexts
+
+
+def make_results(countries):
+    stats = pd.DataFrame({
+        'sentiment_mean': [0.3, 0.1, -0.2][:len(countries)],
+        'sentiment_std': [0.2, 0.25, 0.3][:len(countries)],
+        'sentiment_min': -0.5, 'sentiment_max': 0.8, 'sentiment_median': 0.1,
+        'total_posts': 100, 'democracy_score': 7.5,
+        'region': ['Europa', 'Europa', 'Nordamerika'][:len(countries)],
+        'political_system': 'Demokratie', 'classification': 'Flawed Democracy'
+    }, index=pd.Index(countries, name='country'))
+    monthly = pd.DataFrame({
+        'country': countries, 'month': pd.Period('2024-01', 'M'),
+        'sentiment_mean': 0.1, 'sentiment_std': 0.2, 'post_count': 31
+    })
+    return {'country_stats': stats, 'monthly_trends': monthly}
+
+
+def render(tmp_path, results):
+    return ReportEngine(str(tmp_path), backend=SerialBackend()).render(results)
+
+
+def test_second_run_reuses_all_sections(tmp_path):
+    results = make_results(['deutschland', 'polen', 'usa'])
+    first = render(tmp_path, results)
+    second = render(tmp_path, results)
+
+    assert first['sections_reused'] == 0
+    assert second['sections_rendered'] == 0
+    assert second['files_written'] == 0
+
+
+def test_template_change_rerenders_section(tmp_path, monkeypatch):
+    results = make_results(['deutschland', 'polen', 'usa'])
+    render(tmp_path, results)
+
+    sections = list(report_engine.COUNTRY_SECTIONS)
+    kopf = sections[0]
+    sections[0] = Section('kopf', kopf.head.source.replace('Politisches Sentiment', 'Stimmungsbild'))
+    monkeypatch.setitem(report_engine.SECTIONS, 'country', tuple(sections))
+
+    summary = render(tmp_path, results)
+    assert summary['sections_rendered'] == 3
+    with open(tmp_path / 'countries' / 'usa.md', encoding='utf-8') as f:
+        assert 'Stimmungsbild' in f.read()
+
+
+def test_single_country_region_has_no_nan_spread(tmp_path):
+    render(tmp_path, make_results(['deutschland', 'polen', 'usa']))
+    with open(tmp_path / 'regions' / 'nordamerika.md', encoding='utf-8') as f:
+        assert 'nan' not in f.read()
+    with open(tmp_path / 'regions' / 'europa.md', encoding='utf-8') as f:
+        assert '±' in f.read()
+
+
+def test_country_names_are_slugged():
+    units = build_contexts(make_results(['Bosnien/Herzegowina', 'Costa Rica']))
+    assert set(units) >= {'country/bosnien_herzegowina', 'country/costa_rica'}
+
+
+def test_colliding_file_names_are_rejected():
+    with pytest.raises(ValueError):
+        build_contexts(make_results(['costa rica', 'Costa/Rica']))
+
+
+def test_reports_of_removed_units_are_deleted(tmp_path):
+    render(tmp_path, make_results(['deutschland', 'polen', 'usa']))
+    summary = render(tmp_path, make_results(['deutschland', 'polen']))
+
+    assert summary['files_removed'] == 2
+    assert not os.path.exists(tmp_path / 'countries' / 'usa.md')
+    assert not os.path.exists(tmp_path / 'regions' / 'nordamerika.md')
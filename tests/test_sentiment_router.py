@@ -0,0 +1,78 @@
+# Tests: Sprach-Routing, Lexikon-Scorer und Statistiken des ScoringRouters
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from execution_backends import ProcessPoolBackend, SerialBackend
+from partitioned_executor import PartitionedExecutor
+from post_ingestion import _FIXTURE_COUNTRIES, _FIXTURE_TEXTS, generate_post_fixture, ingest_posts
+from sentiment_analysis import CrossCulturalSentimentAnalyzer
+from sentiment_router import LexiconScorer, ScoringRouter, VaderScorer, default_route, get_scorer
+
+
+@pytest.mark.parametrize('language', sorted(set(_FIXTURE_TEXTS) - {'en'}))
+def test_shipped_lexicons_agree_with_vader_on_fixture_texts(language):
+    assert default_route(language) == language
+    scorer, _ = get_scorer(language)
+    assert isinstance(scorer, LexiconScorer)
+
+    english = VaderScorer().score(np.array(_FIXTURE_TEXTS['en'], dtype=object))
+    translated = scorer.score(np.array(_FIXTURE_TEXTS[language], dtype=object))
+    np.testing.assert_array_equal(np.sign(translated), np.sign(english))
+
+
+def test_fixture_is_scored_end_to_end(tmp_path):
+    path = generate_post_fixture(str(tmp_path / 'posts.jsonl'), n_posts=4_000, days=30)
+    router = ScoringRouter()
+    daily = ingest_posts(path, router, verbose=False)['daily_aggregates']
+
+    scored = daily.groupby(level='country')['n'].sum()
+    assert set(scored.index) == set(_FIXTURE_COUNTRIES)
+    assert scored.sum() == 4_000
+
+    stats = router.stats()
+    assert stats.loc['en', 'scorer'] == 'vader:en'
+    assert (stats.drop('en')['scorer'].str.startswith('lexicon:')).all()
+
+
+def test_unknown_language_and_empty_texts_stay_unscored():
+    batch = pd.DataFrame({
+        'text': ['great news', None, '   ', 'xyz qqq', 'das ist gut'],
+        'language': ['en', 'en', 'de', None, None],
+    })
+    with pytest.warns(UserWarning, match='nicht erkannt'):
+        scored = ScoringRouter()(batch)
+
+    assert scored['sentiment_score'].iloc[0] > 0
+    assert scored['sentiment_score'].iloc[1:4].isna().all()
+    assert scored['language'].tolist()[1:4] == ['und'] * 3
+    # Stoppwort-Erkennung ordnet den deutschen Text dem deutschen Lexikon zu
+    assert scored['language'].iloc[4] == 'de'
+    assert scored['sentiment_score'].iloc[4] > 0
+
+
+@pytest.mark.parametrize('backend_name', ['serial', 'process_pool'])
+def test_partitioned_dump_ingestion_merges_worker_stats(tmp_path, backend_name):
+    analyzer = CrossCulturalSentimentAnalyzer()
+    analyzer.setup_country_data()
+    paths = [
+        generate_post_fixture(str(tmp_path / f'posts_{i}.jsonl'), n_posts=1_000, seed=i, days=30)
+        for i in range(3)
+    ]
+    backend = SerialBackend() if backend_name == 'serial' else ProcessPoolBackend(max_workers=2)
+    router = ScoringRouter()
+
+    results = PartitionedExecutor(analyzer.countries_data, backend).run_dumps(paths, router)
+
+    assert results['partitions'] == 3
+    assert results['daily_aggregates']['n'].sum() == 3_000
+    stats = router.stats()
+    assert stats['posts'].sum() == 3_000
+    assert stats['batches'].sum() == 3 * len(stats)
+    assert results['scoring_stats']['posts'].sum() == 3_000
+
+
+def test_router_rejects_batches_without_text():
+    with pytest.raises(ValueError, match="'text'"):
+        ScoringRouter()(pd.DataFrame({'sentiment_score': [0.1]}))